@@ -6,6 +6,7 @@ import os
 import psutil
 from datetime import datetime
 
+from bot.utils.db_manager import invalidate_guild_language
 from bot.utils.logger import get_logger_for_cog
 
 logger = get_logger_for_cog("admin")
@@ -496,6 +497,9 @@ class BaseCommands(commands.Cog):
                         """,
                         language, inter.guild.id
                     )
+                
+                # Сброс кэша языка, через который его читают остальные модули
+                invalidate_guild_language(inter.guild.id)
             except Exception as e:
                 logger.error(f"Ошибка при обновлении языка в базе данных: {e}")
         
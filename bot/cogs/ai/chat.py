@@ -1,6 +1,5 @@
 import disnake
 from disnake.ext import commands
-import aiohttp
 import logging
 import json
 from datetime import datetime
@@ -19,7 +18,6 @@ class AI(commands.Cog):
         self.model = None
         self.max_tokens = 256
         self.temperature = 0.7
-        self.session = None
         self.chat_histories = {}  # user_id -> [messages]
         
         # Максимальная длина истории для каждого пользователя
@@ -33,9 +31,6 @@ class AI(commands.Cog):
     
     async def cog_load(self):
         """Вызывается при загрузке cog"""
-        # Создание HTTP сессии
-        self.session = aiohttp.ClientSession()
-        
         # Получение настроек из конфигурации
         ai_config = self.bot.config.get("modules", {}).get("ai", {})
         self.api_key = ai_config.get("api_key", "")
@@ -45,11 +40,6 @@ class AI(commands.Cog):
         
         logger.info(f"AI модуль инициализирован (модель: {self.model})")
     
-    async def cog_unload(self):
-        """Вызывается при выгрузке cog"""
-        if self.session:
-            await self.session.close()
-    
     @commands.slash_command(name="ask", description="Задать вопрос искусственному интеллекту")
     async def ask(
         self, 
@@ -212,7 +202,7 @@ class AI(commands.Cog):
         }
         
         try:
-            async with self.session.post(self.openai_url, headers=headers, json=payload) as response:
+            async with self.bot.http_session.post(self.openai_url, headers=headers, json=payload) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data["choices"][0]["message"]["content"].strip()
@@ -250,7 +240,7 @@ class AI(commands.Cog):
         }
         
         try:
-            async with self.session.post(self.grok_url, headers=headers, json=payload) as response:
+            async with self.bot.http_session.post(self.grok_url, headers=headers, json=payload) as response:
                 if response.status == 200:
                     data = await response.json()
                     # Адаптируйте этот код под реальный формат ответа Grok API
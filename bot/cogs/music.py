@@ -9,12 +9,13 @@ Includes features for playing music from YouTube, SoundCloud, and Spotify.
 import disnake
 from disnake.ext import commands
 import asyncio
-import datetime
 import logging
 import re
 import random
+from collections import defaultdict
+from functools import lru_cache
 from typing import Optional
-from sqlalchemy.future import select
+from sqlalchemy import func, update
 import wavelink
 from wavelink.ext import spotify
 
@@ -23,6 +24,15 @@ from bot.utils.localization import _
 from bot.utils.db_manager import get_session, get_guild_language
 from bot.models import CommandUsage, MusicSession
 
+# Embed colors are immutable, so build them once instead of per response
+_RED = disnake.Color.red()
+_GREEN = disnake.Color.green()
+_BLUE = disnake.Color.blue()
+_ORANGE = disnake.Color.orange()
+
+# How often buffered songs_played counters are written to the database
+SONGS_PLAYED_FLUSH_INTERVAL = 60
+
 class Music(commands.Cog):
     """Music commands for playing audio in voice channels"""
     
@@ -32,9 +42,15 @@ class Music(commands.Cog):
         self.wavelink = None
         # Active music sessions
         self.sessions = {}
+        # Buffered songs_played deltas: db session id -> count
+        self._pending_increments = defaultdict(int)
+        self._flush_task = None
+        # Final flush started on unload; referenced so it is not garbage collected mid-write
+        self._final_flush_task = None
     
     async def cog_load(self):
         """Called when the cog is loaded"""
+        self._flush_task = asyncio.create_task(self._flush_increments_loop())
         try:
             # Initialize wavelink nodes for music playback
             await self.setup_wavelink()
@@ -42,6 +58,15 @@ class Music(commands.Cog):
         except Exception as e:
             self.logger.error(f"Failed to initialize Wavelink: {e}")
     
+    def cog_unload(self):
+        """Called when the cog is unloaded"""
+        if self._flush_task:
+            self._flush_task.cancel()
+        
+        # Write out whatever is still buffered
+        if self._pending_increments:
+            self._final_flush_task = asyncio.create_task(self._flush_increments())
+    
     async def setup_wavelink(self):
         """Set up the Wavelink connection"""
         # Get configuration
@@ -108,7 +133,7 @@ class Music(commands.Cog):
                 if 'now_playing_message' in self.sessions[guild_id]:
                     try:
                         await self.sessions[guild_id]['now_playing_message'].delete()
-                    except:
+                    except (disnake.NotFound, disnake.Forbidden, disnake.HTTPException):
                         pass
                 
                 del self.sessions[guild_id]
@@ -133,7 +158,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("You must be in a voice channel to use this command.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             return None, embed
         
@@ -160,7 +185,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("You must be in the same voice channel as the bot to use this command.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             return None, embed
         
@@ -222,7 +247,7 @@ class Music(commands.Cog):
                         embed = create_embed(
                             title=_("Playlist Added", lang),
                             description=_("Added Spotify playlist to the queue", lang),
-                            color=disnake.Color.green()
+                            color=_GREEN
                         )
                         
                         if 'now_playing_message' not in self.sessions[interaction.guild.id]:
@@ -251,7 +276,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("Could not find tracks for your query. Please try a different search or URL.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.edit_original_message(embed=embed)
             return
@@ -267,7 +292,7 @@ class Music(commands.Cog):
                 embed = create_embed(
                     title=_("Added to Queue", lang),
                     description=_("**{title}** has been added to the queue", lang).format(title=track.title),
-                    color=disnake.Color.green()
+                    color=_GREEN
                 )
                 embed.add_field(
                     name=_("Duration", lang),
@@ -297,7 +322,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("No tracks found for your query.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.edit_original_message(embed=embed)
             return
@@ -323,7 +348,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("Nothing is currently playing.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -338,7 +363,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Skipped", lang),
                 description=_("Skipped the current song. No more songs in queue.", lang),
-                color=disnake.Color.blue()
+                color=_BLUE
             )
             
             # Delete now playing message if it exists
@@ -346,7 +371,7 @@ class Music(commands.Cog):
                 try:
                     await self.sessions[interaction.guild.id]['now_playing_message'].delete()
                     self.sessions[interaction.guild.id].pop('now_playing_message')
-                except:
+                except (disnake.NotFound, disnake.Forbidden, disnake.HTTPException):
                     pass
         else:
             # Skip to next track
@@ -359,7 +384,7 @@ class Music(commands.Cog):
                 description=_("Skipped **{title}**", lang).format(
                     title=current_track.title if current_track else "Current song"
                 ),
-                color=disnake.Color.blue()
+                color=_BLUE
             )
             
             # Update now playing message if it exists
@@ -406,7 +431,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Queue", lang),
                 description=_("The queue is empty.", lang),
-                color=disnake.Color.blue()
+                color=_BLUE
             )
             await interaction.response.send_message(embed=embed)
             return
@@ -422,7 +447,7 @@ class Music(commands.Cog):
         # Create embed
         embed = create_embed(
             title=_("Music Queue", lang),
-            color=disnake.Color.blue()
+            color=_BLUE
         )
         
         # Add currently playing track
@@ -534,7 +559,7 @@ class Music(commands.Cog):
                 
                 try:
                     await interaction.edit_original_message(components=components)
-                except:
+                except (disnake.NotFound, disnake.Forbidden, disnake.HTTPException):
                     pass
         
         # Log command usage
@@ -558,7 +583,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("Nothing is currently playing.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -568,7 +593,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Already Paused", lang),
                 description=_("The player is already paused. Use `/resume` to continue playback.", lang),
-                color=disnake.Color.orange()
+                color=_ORANGE
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -579,7 +604,7 @@ class Music(commands.Cog):
         embed = create_embed(
             title=_("Paused", lang),
             description=_("Playback has been paused. Use `/resume` to continue.", lang),
-            color=disnake.Color.blue()
+            color=_BLUE
         )
         await interaction.response.send_message(embed=embed)
         
@@ -604,7 +629,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("Nothing is currently playing.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -614,7 +639,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Already Playing", lang),
                 description=_("The player is already playing.", lang),
-                color=disnake.Color.orange()
+                color=_ORANGE
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -625,7 +650,7 @@ class Music(commands.Cog):
         embed = create_embed(
             title=_("Resumed", lang),
             description=_("Playback has been resumed.", lang),
-            color=disnake.Color.green()
+            color=_GREEN
         )
         await interaction.response.send_message(embed=embed)
         
@@ -650,7 +675,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("Nothing is currently playing.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -664,13 +689,13 @@ class Music(commands.Cog):
             try:
                 await self.sessions[interaction.guild.id]['now_playing_message'].delete()
                 self.sessions[interaction.guild.id].pop('now_playing_message')
-            except:
+            except (disnake.NotFound, disnake.Forbidden, disnake.HTTPException):
                 pass
         
         embed = create_embed(
             title=_("Stopped", lang),
             description=_("Playback has been stopped and the queue has been cleared.", lang),
-            color=disnake.Color.red()
+            color=_RED
         )
         await interaction.response.send_message(embed=embed)
         
@@ -706,7 +731,7 @@ class Music(commands.Cog):
         embed = create_embed(
             title=_("Volume Set", lang),
             description=_("Volume set to **{level}%**", lang).format(level=level),
-            color=disnake.Color.blue()
+            color=_BLUE
         )
         await interaction.response.send_message(embed=embed)
         
@@ -731,7 +756,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Now Playing", lang),
                 description=_("Nothing is currently playing.", lang),
-                color=disnake.Color.blue()
+                color=_BLUE
             )
             await interaction.response.send_message(embed=embed)
             return
@@ -769,7 +794,7 @@ class Music(commands.Cog):
             embed = create_embed(
                 title=_("Error", lang),
                 description=_("The queue is empty. Add some songs first.", lang),
-                color=disnake.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -780,7 +805,7 @@ class Music(commands.Cog):
         embed = create_embed(
             title=_("Queue Shuffled", lang),
             description=_("The music queue has been shuffled.", lang),
-            color=disnake.Color.green()
+            color=_GREEN
         )
         await interaction.response.send_message(embed=embed)
         
@@ -800,21 +825,20 @@ class Music(commands.Cog):
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
             return
         
-        # End music session in database
-        await self.end_music_session(interaction.guild.id)
+        # Database, voice gateway and REST cleanup are independent, so run them concurrently
+        cleanup = [self.end_music_session(interaction.guild.id)]
         
         # Clear queue and disconnect
         if player:
             player.queue.clear()
-            await player.stop()
-            await player.disconnect()
+            cleanup.append(self._teardown_player(player))
         
         # Delete now playing message if it exists
-        if interaction.guild.id in self.sessions and 'now_playing_message' in self.sessions[interaction.guild.id]:
-            try:
-                await self.sessions[interaction.guild.id]['now_playing_message'].delete()
-            except:
-                pass
+        now_playing_message = self.sessions.get(interaction.guild.id, {}).get('now_playing_message')
+        if now_playing_message:
+            cleanup.append(self._delete_message(now_playing_message))
+        
+        await asyncio.gather(*cleanup)
         
         # Clean up session data
         if interaction.guild.id in self.sessions:
@@ -823,19 +847,31 @@ class Music(commands.Cog):
         embed = create_embed(
             title=_("Disconnected", lang),
             description=_("Disconnected from voice channel.", lang),
-            color=disnake.Color.red()
+            color=_RED
         )
         await interaction.response.send_message(embed=embed)
         
         # Log command usage
         await self.log_command(interaction.author.id, interaction.guild.id, "disconnect")
     
+    async def _teardown_player(self, player):
+        """Stop playback and leave the voice channel"""
+        await player.stop()
+        await player.disconnect()
+    
+    async def _delete_message(self, message):
+        """Delete a message, ignoring it if it is already gone"""
+        try:
+            await message.delete()
+        except (disnake.NotFound, disnake.Forbidden, disnake.HTTPException):
+            pass
+    
     def create_now_playing_embed(self, track, lang):
         """Create an embed for the now playing track"""
         embed = create_embed(
             title=_("Now Playing", lang),
             description=f"**{track.title}**",
-            color=disnake.Color.blue()
+            color=_BLUE
         )
         
         # Add track info
@@ -878,8 +914,10 @@ class Music(commands.Cog):
         
         return embed
     
-    def format_duration(self, milliseconds):
-        """Format milliseconds into a readable duration"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_duration(milliseconds):
+        """Format milliseconds into a readable duration (memoized, track lengths repeat)"""
         seconds = milliseconds // 1000
         minutes, seconds = divmod(seconds, 60)
         hours, minutes = divmod(minutes, 60)
@@ -895,15 +933,13 @@ class Music(commands.Cog):
             async with get_session() as session:
                 music_session = MusicSession(
                     guild_id=guild_id,
-                    created_at=datetime.datetime.utcnow(),
                     songs_played=0
                 )
                 session.add(music_session)
                 await session.commit()
                 
                 # Store session ID
-                if guild_id in self.sessions:
-                    self.sessions[guild_id]['db_session_id'] = music_session.id
+                self.sessions.setdefault(guild_id, {})['db_session_id'] = music_session.id
                 
                 self.logger.info(f"Started music session {music_session.id} for guild {guild_id}")
         except Exception as e:
@@ -911,50 +947,73 @@ class Music(commands.Cog):
     
     async def end_music_session(self, guild_id):
         """Record the end of a music session in the database"""
+        # Get session ID from memory
+        session_id = self.sessions.get(guild_id, {}).get('db_session_id')
+        
+        if not session_id:
+            return
+        
+        # Fold any buffered song count into the same UPDATE
+        values = {'ended_at': func.now()}
+        delta = self._pending_increments.pop(session_id, 0)
+        if delta:
+            values['songs_played'] = MusicSession.songs_played + delta
+        
         try:
-            # Get session ID from memory
-            session_id = None
-            if guild_id in self.sessions and 'db_session_id' in self.sessions[guild_id]:
-                session_id = self.sessions[guild_id]['db_session_id']
-            
-            if not session_id:
-                return
-            
             async with get_session() as session:
-                # Get the music session
-                query = select(MusicSession).where(MusicSession.id == session_id)
+                # Let the database stamp the end time
+                query = (
+                    update(MusicSession)
+                    .where(MusicSession.id == session_id)
+                    .values(**values)
+                )
                 result = await session.execute(query)
-                music_session = result.scalar_one_or_none()
+                await session.commit()
                 
-                if music_session:
-                    music_session.ended_at = datetime.datetime.utcnow()
-                    await session.commit()
+                if result.rowcount:
                     self.logger.info(f"Ended music session {session_id} for guild {guild_id}")
         except Exception as e:
             self.logger.error(f"Error ending music session: {e}")
+            # Put the count back so the next flush retries it
+            if delta:
+                self._pending_increments[session_id] += delta
     
     async def increment_songs_played(self, guild_id):
-        """Increment the songs played counter for the current session"""
+        """
+        Increment the songs played counter for the current session.
+        
+        The count is buffered in memory and written by _flush_increments.
+        """
+        session_id = self.sessions.get(guild_id, {}).get('db_session_id')
+        if session_id:
+            self._pending_increments[session_id] += 1
+    
+    async def _flush_increments(self):
+        """Write all buffered songs_played counters in a single transaction"""
+        pending, self._pending_increments = self._pending_increments, defaultdict(int)
+        if not pending:
+            return
+        
         try:
-            # Get session ID from memory
-            session_id = None
-            if guild_id in self.sessions and 'db_session_id' in self.sessions[guild_id]:
-                session_id = self.sessions[guild_id]['db_session_id']
-            
-            if not session_id:
-                return
-            
             async with get_session() as session:
-                # Get the music session
-                query = select(MusicSession).where(MusicSession.id == session_id)
-                result = await session.execute(query)
-                music_session = result.scalar_one_or_none()
-                
-                if music_session:
-                    music_session.songs_played += 1
-                    await session.commit()
+                for session_id, delta in pending.items():
+                    await session.execute(
+                        update(MusicSession)
+                        .where(MusicSession.id == session_id)
+                        .values(songs_played=MusicSession.songs_played + delta)
+                    )
+                await session.commit()
         except Exception as e:
             self.logger.error(f"Error incrementing songs played: {e}")
+            # Put the counts back so the next flush retries them
+            for session_id, delta in pending.items():
+                self._pending_increments[session_id] += delta
+    
+    async def _flush_increments_loop(self):
+        """Periodically flush buffered songs_played counters"""
+        while True:
+            await asyncio.sleep(SONGS_PLAYED_FLUSH_INTERVAL)
+            await self._flush_increments()
     
     async def log_command(self, user_id, guild_id, command_name):
         """Log command usage to the database"""
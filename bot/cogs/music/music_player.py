@@ -3,33 +3,146 @@ import disnake
 from disnake.ext import commands
 import logging
 import wavelink
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Union, Tuple
 import re
 import random
+import copy
+from collections import OrderedDict
+from functools import lru_cache
 
 from bot.utils.logger import get_logger_for_cog
 
 logger = get_logger_for_cog("music")
 
 # Регулярные выражения для распознавания URL
-SPOTIFY_REGEX = re.compile(r"https?://open.spotify.com/(?P<type>album|playlist|track)/(?P<id>[a-zA-Z0-9]+)")
 YOUTUBE_REGEX = re.compile(r"^(https?://)?(www\.)?(youtube\.com|youtu\.?be)/.+$")
-YOUTUBE_PLAYLIST_REGEX = re.compile(r"^(https?://)?(www\.)?youtube\.com/playlist\?list=.+$")
+
+# Разбор запроса одним проходом: имя сработавшей группы определяет тип URL
+URL_DISPATCH_REGEX = re.compile(
+    r"(?P<spotify>https?://open\.spotify\.com/(?P<type>album|playlist|track)/(?P<id>[a-zA-Z0-9]+))"
+    r"|(?P<playlist>https?://(?:www\.)?youtube\.com/playlist\?list=.+)"
+    r"|(?P<url>https?://.+)",
+    re.ASCII
+)
+
+# Ограничение частоты команд управления плеером: COMMAND_RATE вызовов за COMMAND_PER секунд
+COMMAND_RATE = 3
+COMMAND_PER = 5.0
+
+# Размер страницы очереди подбирается под лимит описания эмбеда по средней длине строки
+EMBED_DESCRIPTION_LIMIT = 4096
+QUEUE_PAGE_BUDGET = 3900  # запас под разброс длины строк
+QUEUE_PAGE_MIN = 10
+QUEUE_PAGE_MAX = 50
+QUEUE_PAGE_SAMPLE = 20
+
+# Кэш результатов поиска для повторных запросов
+SEARCH_CACHE_TTL = 30  # секунд
+SEARCH_CACHE_SIZE = 256
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Форматирование целого числа секунд (длительности треков часто совпадают)"""
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    else:
+        return f"{minutes:02d}:{seconds:02d}"
+
+def format_duration(ms: int) -> str:
+    """
+    Форматирование продолжительности в формат ЧЧ:ММ:СС
+    
+    Args:
+        ms (int): Продолжительность в миллисекундах
+    
+    Returns:
+        str: Отформатированная продолжительность
+    """
+    return _format_seconds(ms // 1000)
+
+def format_queue_entry(position: int, track, limit: Optional[int] = None) -> str:
+    """
+    Форматирование строки трека для списка очереди
+    
+    Args:
+        position (int): Позиция трека в очереди
+        track (wavelink.Playable): Трек
+        limit (int, optional): Максимальная длина строки, None - без ограничения
+    
+    Returns:
+        str: Строка вида "**1.** Название - Автор [03:30] (пользователь)"
+    """
+    requester = getattr(track, 'requested_by', None)
+    prefix = f"**{position}.** "
+    suffix = f" [{format_duration(track.length)}]" + (f" ({requester})" if requester else "")
+    text = f"{track.title} - {track.author}"
+    
+    # Обрезается название и автор, номер, длительность и пользователь остаются видны
+    if limit is not None:
+        room = limit - len(prefix) - len(suffix)
+        if len(text) > room:
+            text = text[:max(room - 1, 0)] + "…"
+    
+    return f"{prefix}{text}{suffix}"
+
+class MusicStrings(NamedTuple):
+    """Локализованные строки музыкального модуля для одного языка"""
+    now_playing: str
+    duration: str
+    author: str
+    source: str
+    link: str
+    position: str
+    requested_by: str
+    not_in_voice: str
+    already_voted: str
+
+# Ключи языковых файлов для полей MusicStrings
+MUSIC_STRING_KEYS = MusicStrings(
+    now_playing="music.play.now_playing",
+    duration="music.play.duration",
+    author="music.play.author",
+    source="music.play.source",
+    link="music.play.link",
+    position="music.play.position",
+    requested_by="music.play.requested_by",
+    not_in_voice="music.play.not_in_voice",
+    already_voted="music.skip.already_voted",
+)
 
 class MusicPlayer(wavelink.Player):
     """Расширенный класс плеера для управления музыкой"""
     
+    # Только собственные атрибуты: queue, current, autoplay и loop
+    # пересекаются с атрибутами и свойствами wavelink.Player
+    __slots__ = (
+        'waiting',
+        'bound_channel',
+        'last_activity',
+        'skip_votes',
+        'human_count',
+        '_idle_handle',
+        'np_message',
+        'np_key',
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.queue = wavelink.Queue()
         self.waiting = False
         self.current = None
         self.bound_channel = None
-        self.last_activity = datetime.utcnow()
+        self.last_activity = asyncio.get_running_loop().time()
         self.autoplay = False
         self.loop = False
         self.skip_votes = set()
+        self.human_count = 0
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        self.np_message: Optional[disnake.Message] = None
+        self.np_key: Optional[Tuple[str, str, Optional[str]]] = None
 
 class Music(commands.Cog):
     """Команды для воспроизведения музыки"""
@@ -42,9 +155,35 @@ class Music(commands.Cog):
         self.youtube_api_key = None
         self.default_volume = 50
         
+        # Кэш локализованных строк
+        self._strings: Dict[str, MusicStrings] = {}
+        self._np_templates: Dict[str, Dict[str, Any]] = {}
+        self._embed_templates: Dict[Tuple[str, str, str], disnake.Embed] = {}
+        
+        # Кэш результатов поиска: запрос -> (время, треки)
+        self._search_cache: "OrderedDict[str, Tuple[float, List[wavelink.Playable]]]" = OrderedDict()
+        
+        # Фоновые задачи: asyncio хранит на них только слабые ссылки
+        self._bg_tasks = set()
+        
+        # Цвета эмбедов и таймаут неактивности из конфигурации
+        self._load_settings()
+        
         # Запуск задачи инициализации
         asyncio.create_task(self.initialize())
     
+    def _load_settings(self):
+        """Предварительный расчет цветов эмбедов и таймаута из конфигурации"""
+        colors = self.bot.config.get('embed', {}).get('colors', {})
+        self._colors = {
+            'default': disnake.Color(colors.get('default', 0x3498db)),
+            'success': disnake.Color(colors.get('success', 0x2ecc71)),
+            'info': disnake.Color(colors.get('info', 0x7289da)),
+        }
+        
+        self._timeout_minutes = self.bot.config.get("modules", {}).get("music", {}).get("timeout_minutes", 5)
+        self._timeout = self._timeout_minutes * 60.0
+    
     async def initialize(self):
         """Инициализация музыкального модуля"""
         # Ожидание готовности бота
@@ -75,45 +214,100 @@ class Music(commands.Cog):
             logger.info("Музыкальный модуль успешно инициализирован и подключен к Lavalink")
         except Exception as e:
             logger.error(f"Ошибка при инициализации музыкального модуля: {e}")
+    
+    def _schedule_idle_disconnect(self, player: MusicPlayer, delay: Optional[float] = None):
+        """
+        Планирование отключения плеера после периода неактивности
         
-        # Запуск проверки неактивных плееров
-        self.bot.loop.create_task(self.check_inactive_players())
+        Args:
+            player (MusicPlayer): Плеер
+            delay (float, optional): Задержка в секундах. По умолчанию таймаут неактивности
+        """
+        self._cancel_idle_disconnect(player)
+        
+        if delay is None:
+            delay = self._timeout
+        
+        guild_id = player.guild.id
+        player._idle_handle = self.bot.loop.call_later(
+            delay,
+            lambda: self.spawn(self._idle_disconnect(guild_id))
+        )
     
-    async def check_inactive_players(self):
-        """Проверка и отключение неактивных плееров"""
-        await self.bot.wait_until_ready()
+    def spawn(self, coro):
+        """Запуск корутины в фоне с сохранением ссылки и логированием ошибок"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+        return task
+    
+    def _on_bg_task_done(self, task):
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Ошибка фоновой задачи: {task.exception()}")
+    
+    def _cancel_idle_disconnect(self, player: MusicPlayer):
+        """Отмена запланированного отключения плеера"""
+        if player._idle_handle:
+            player._idle_handle.cancel()
+            player._idle_handle = None
+    
+    async def _idle_disconnect(self, guild_id: int):
+        """Отключение неактивного плеера по истечении таймаута"""
+        player = self.players.get(guild_id)
         
-        while not self.bot.is_closed():
-            try:
-                timeout_minutes = self.bot.config.get("modules", {}).get("music", {}).get("timeout_minutes", 5)
-                timeout = timedelta(minutes=timeout_minutes)
-                
-                for guild_id, player in list(self.players.items()):
-                    # Проверка активности плеера
-                    if (
-                        not player.is_playing() and 
-                        not player.waiting and 
-                        not player.queue and
-                        datetime.utcnow() - player.last_activity > timeout
-                    ):
-                        try:
-                            # Отключение от голосового канала
-                            guild = self.bot.get_guild(guild_id)
-                            if guild:
-                                await player.disconnect()
-                            
-                            # Удаление плеера
-                            del self.players[guild_id]
-                            
-                            logger.info(f"Отключен неактивный музыкальный плеер на сервере {guild_id}")
-                        except Exception as e:
-                            logger.error(f"Ошибка при отключении неактивного плеера на сервере {guild_id}: {e}")
+        if not player:
+            return
+        
+        player._idle_handle = None
+        
+        # Плеер снова используется
+        if player.is_playing() or player.waiting or player.queue:
+            return
+        
+        # Активность после планирования продлевает таймаут
+        idle_for = self.bot.loop.time() - player.last_activity
+        if idle_for < self._timeout:
+            self._schedule_idle_disconnect(player, self._timeout - idle_for)
+            return
+        
+        try:
+            # Отключение от голосового канала
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                await player.disconnect()
             
-            except Exception as e:
-                logger.error(f"Ошибка при проверке неактивных плееров: {e}")
+            # Удаление плеера
+            self.players.pop(guild_id, None)
             
-            # Проверка каждую минуту
-            await asyncio.sleep(60)
+            logger.info(f"Отключен неактивный музыкальный плеер на сервере {guild_id}")
+        except Exception as e:
+            logger.error(f"Ошибка при отключении неактивного плеера на сервере {guild_id}: {e}")
+    
+    async def cog_slash_command_error(self, inter: disnake.ApplicationCommandInteraction, error: Exception):
+        """Обработка ошибок команд модуля"""
+        guild_language = await self.bot.get_guild_language(inter.guild.id)
+        
+        if isinstance(error, commands.CommandOnCooldown):
+            # Лишние вызовы отклоняются без обращения к плееру
+            text = self.bot.language_manager.get_text(
+                "commands.common.cooldown",
+                guild_language,
+                time=round(error.retry_after, 1)
+            )
+        else:
+            # Обработчик модуля заменяет стандартный вывод disnake, поэтому трассировку пишем сами
+            logger.error(
+                f"Ошибка в команде {inter.application_command.qualified_name}: {error}",
+                exc_info=error
+            )
+            text = self.bot.language_manager.get_text("commands.common.error", guild_language)
+        
+        # Пользователь получает ответ, даже если команда уже ответила на взаимодействие
+        if inter.response.is_done():
+            await inter.followup.send(text, ephemeral=True)
+        else:
+            await inter.response.send_message(text, ephemeral=True)
     
     # ===== Обработчики событий Wavelink =====
     
@@ -133,64 +327,100 @@ class Music(commands.Cog):
         # Обновление текущего трека
         player.current = payload.track
         
+        # Плеер снова активен
+        self._cancel_idle_disconnect(player)
+        
         # Обновление времени активности
-        player.last_activity = datetime.utcnow()
+        player.last_activity = self.bot.loop.time()
         
         # Очистка голосования за пропуск
         player.skip_votes.clear()
         
         # Отправка информации о текущем треке
-        if player.bound_channel:
-            try:
-                # Определение языка сервера
-                guild_language = await self.bot.get_guild_language(player.guild.id)
-                
-                # Создание эмбеда
-                embed = disnake.Embed(
-                    title=self.bot.language_manager.get_text("music.play.now_playing", guild_language),
-                    description=f"**{payload.track.title}**",
-                    color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('default', 0x3498db))
-                )
-                
-                embed.add_field(
-                    name=self.bot.language_manager.get_text("music.play.duration", guild_language),
-                    value=self._format_duration(payload.track.length),
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name=self.bot.language_manager.get_text("music.play.author", guild_language),
-                    value=payload.track.author,
-                    inline=True
-                )
-                
-                if payload.track.uri:
-                    embed.add_field(
-                        name=self.bot.language_manager.get_text("music.play.source", guild_language),
-                        value=f"[{self.bot.language_manager.get_text('music.play.link', guild_language)}]({payload.track.uri})",
-                        inline=True
-                    )
-                
-                # Добавление обложки трека, если доступна
-                if hasattr(payload.track, 'artwork') and payload.track.artwork:
-                    embed.set_thumbnail(url=payload.track.artwork)
-                
-                # Добавление информации о запросившем пользователе
-                if hasattr(payload.track, 'requested_by') and payload.track.requested_by:
-                    embed.set_footer(
-                        text=self.bot.language_manager.get_text(
-                            "music.play.requested_by", 
-                            guild_language,
-                            user=str(payload.track.requested_by)
-                        ),
-                        icon_url=payload.track.requested_by.display_avatar.url
-                    )
-                
-                # Отправка сообщения
-                await player.bound_channel.send(embed=embed)
+        track = payload.track
+        np_key = (track.title, track.author, track.uri)
+        
+        # Тот же трек (например, при повторе) уже показан
+        channel = player.bound_channel
+        if not channel or np_key == player.np_key:
+            return
+        
+        # Канал удален или у бота нет прав на отправку эмбедов
+        guild = getattr(channel, 'guild', None)
+        if not guild or not guild.get_channel_or_thread(channel.id):
+            return
+        
+        permissions = channel.permissions_for(guild.me)
+        if not (permissions.send_messages and permissions.embed_links):
+            return
+        
+        try:
+            # Определение языка сервера
+            guild_language = await self.bot.get_guild_language(player.guild.id)
+            strings = self._strings_for(guild_language)
             
-            except Exception as e:
-                logger.error(f"Ошибка при отправке информации о текущем треке: {e}")
+            # Создание эмбеда из шаблона с уже локализованными заголовками
+            template = self._np_templates.get(guild_language)
+            if template is None:
+                template = self._np_templates[guild_language] = {
+                    'title': strings.now_playing,
+                    'color': self._colors['default'].value,
+                }
+            
+            fields = [
+                {'name': strings.duration, 'value': format_duration(track.length), 'inline': True},
+                {'name': strings.author, 'value': track.author, 'inline': True},
+            ]
+            
+            if track.uri:
+                fields.append({'name': strings.source, 'value': f"[{strings.link}]({track.uri})", 'inline': True})
+            
+            data = dict(template, description=f"**{track.title}**", fields=fields)
+            
+            # Добавление обложки трека, если доступна
+            artwork = getattr(track, 'artwork', None)
+            if artwork:
+                data['thumbnail'] = {'url': artwork}
+            
+            # Добавление информации о запросившем пользователе
+            requester = getattr(track, 'requested_by', None)
+            if requester:
+                data['footer'] = {
+                    'text': strings.requested_by.format(user=str(requester)),
+                    'icon_url': requester.display_avatar.url
+                }
+            
+            embed = disnake.Embed.from_dict(data)
+            
+            # Редактирование предыдущего сообщения, если оно последнее в канале
+            message = player.np_message
+            
+            if (
+                message is not None and
+                message.channel.id == channel.id and
+                getattr(channel, 'last_message_id', None) == message.id
+            ):
+                try:
+                    await message.edit(embed=embed)
+                except disnake.NotFound:
+                    message = None
+            else:
+                message = None
+            
+            # Отправка нового сообщения
+            if message is None:
+                message = await channel.send(embed=embed)
+            
+            player.np_message = message
+            player.np_key = np_key
+        
+        except (disnake.Forbidden, disnake.NotFound):
+            # Канал удален или права отозваны
+            return
+        except disnake.HTTPException as e:
+            logger.warning(f"Не удалось отправить информацию о текущем треке: {e}")
+        except Exception as e:
+            logger.error(f"Ошибка при отправке информации о текущем треке: {e}")
     
     @commands.Cog.listener()
     async def on_wavelink_track_end(self, payload: wavelink.TrackEndEventPayload):
@@ -201,7 +431,7 @@ class Music(commands.Cog):
             return
         
         # Обновление времени активности
-        player.last_activity = datetime.utcnow()
+        player.last_activity = self.bot.loop.time()
         
         # Проверка, если трек должен повторяться
         if player.loop and payload.track and payload.reason == "FINISHED":
@@ -215,8 +445,7 @@ class Music(commands.Cog):
             not player.queue and 
             payload.reason == "FINISHED" and 
             payload.track and 
-            hasattr(payload.track, 'uri') and 
-            payload.track.uri
+            getattr(payload.track, 'uri', None)
         ):
             try:
                 # Добавление похожего трека в очередь
@@ -224,8 +453,9 @@ class Music(commands.Cog):
                 
                 if suggested:
                     # Установка атрибута requested_by
-                    if hasattr(payload.track, 'requested_by') and payload.track.requested_by:
-                        suggested.requested_by = payload.track.requested_by
+                    requester = getattr(payload.track, 'requested_by', None)
+                    if requester:
+                        suggested.requested_by = requester
                     
                     await player.queue.put_wait(suggested)
                     
@@ -234,9 +464,11 @@ class Music(commands.Cog):
             except Exception as e:
                 logger.error(f"Ошибка при получении похожего трека: {e}")
         
-        # Если в очереди нет треков, сбрасываем текущий трек
+        # Если в очереди нет треков, сбрасываем текущий трек и ждем таймаут неактивности
         if not player.queue:
             player.current = None
+            player.np_key = None
+            self._schedule_idle_disconnect(player)
     
     @commands.Cog.listener()
     async def on_wavelink_node_closed(self, node: wavelink.Node):
@@ -246,40 +478,50 @@ class Music(commands.Cog):
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
         """Обработка изменений голосовых состояний"""
-        if not member.guild:
+        # Мьют, наушники, видео и т.п. без смены канала нас не интересуют
+        if before.channel == after.channel or not member.guild:
+            return
+        
+        # Сервер без плеера
+        guild_id = member.guild.id
+        player = self.players.get(guild_id)
+        if player is None:
             return
         
         if member.id == self.bot.user.id:
+            # Бот перешел в другой канал: пересчет слушателей
+            if after.channel:
+                player.human_count = self._count_humans(after.channel)
+            
             # Бот был отключен от голосового канала
-            if before.channel and not after.channel:
-                guild_id = member.guild.id
+            elif before.channel:
+                self._cancel_idle_disconnect(player)
                 
-                if guild_id in self.players:
-                    player = self.players[guild_id]
-                    
-                    # Очистка очереди и остановка воспроизведения
-                    player.queue.clear()
-                    await player.stop()
-                    player.current = None
-                    
-                    # Удаление плеера
-                    del self.players[guild_id]
-                    
-                    logger.info(f"Плеер удален после отключения от голосового канала на сервере {guild_id}")
+                # Очистка очереди и остановка воспроизведения
+                player.queue.clear()
+                await player.stop()
+                player.current = None
+                
+                # Удаление плеера
+                self.players.pop(guild_id, None)
+                
+                logger.info(f"Плеер удален после отключения от голосового канала на сервере {guild_id}")
             
             return
         
+        # Учет слушателей в канале плеера
+        if not member.bot:
+            if before.channel and before.channel == player.channel:
+                player.human_count -= 1
+            if after.channel and after.channel == player.channel:
+                player.human_count += 1
+        
         # Проверка, остался ли бот один в голосовом канале
         if (
             before.channel and 
-            before.channel.guild.id in self.players and 
-            len([m for m in before.channel.members if not m.bot]) == 0
+            not any(not m.bot for m in before.channel.members)
         ):
-            # Бот остался один в голосовом канале
-            guild_id = before.channel.guild.id
-            player = self.players[guild_id]
-            
-            # Приостановка воспроизведения
+            # Бот остался один в голосовом канале, приостановка воспроизведения
             if player.is_playing():
                 await player.pause()
                 player.waiting = True
@@ -292,22 +534,20 @@ class Music(commands.Cog):
                         empty_message = self.bot.language_manager.get_text(
                             "music.voice_empty", 
                             guild_language,
-                            timeout=self.bot.config.get("modules", {}).get("music", {}).get("timeout_minutes", 5)
+                            timeout=self._timeout_minutes
                         )
                         
                         await player.bound_channel.send(empty_message)
+                    except (disnake.Forbidden, disnake.NotFound):
+                        # Канал удален или права отозваны
+                        pass
+                    except disnake.HTTPException as e:
+                        logger.warning(f"Не удалось отправить уведомление о пустом голосовом канале: {e}")
                     except Exception as e:
                         logger.error(f"Ошибка при отправке уведомления о пустом голосовом канале: {e}")
         
         # Проверка, если кто-то присоединился к голосовому каналу, где бот на паузе
-        elif (
-            after.channel and 
-            after.channel.guild.id in self.players and 
-            not member.bot
-        ):
-            guild_id = after.channel.guild.id
-            player = self.players[guild_id]
-            
+        elif after.channel and not member.bot:
             # Возобновление воспроизведения, если оно было приостановлено из-за пустого канала
             if player.is_paused() and player.waiting:
                 await player.resume()
@@ -324,11 +564,92 @@ class Music(commands.Cog):
                         )
                         
                         await player.bound_channel.send(resume_message)
+                    except (disnake.Forbidden, disnake.NotFound):
+                        # Канал удален или права отозваны
+                        pass
+                    except disnake.HTTPException as e:
+                        logger.warning(f"Не удалось отправить уведомление о возобновлении воспроизведения: {e}")
                     except Exception as e:
                         logger.error(f"Ошибка при отправке уведомления о возобновлении воспроизведения: {e}")
     
     # ===== Вспомогательные методы =====
     
+    def _template_embed(self, guild_language: str, title_key: str, kind: str) -> disnake.Embed:
+        """
+        Получение копии шаблонного эмбеда с локализованным заголовком и цветом
+        
+        Embed.copy() копирует и списки полей, поэтому результат можно свободно изменять.
+        
+        Args:
+            guild_language (str): Код языка сервера
+            title_key (str): Ключ заголовка
+            kind (str): Тип цвета ('success', 'info', 'default')
+        
+        Returns:
+            disnake.Embed: Копия шаблона
+        """
+        key = (guild_language, title_key, kind)
+        template = self._embed_templates.get(key)
+        
+        if template is None:
+            template = disnake.Embed(
+                title=self.bot.language_manager.get_text(title_key, guild_language),
+                color=self._colors[kind]
+            )
+            self._embed_templates[key] = template
+        
+        return template.copy()
+    
+    async def _reject_not_in_voice(
+        self,
+        inter: disnake.ApplicationCommandInteraction,
+        player: MusicPlayer,
+        guild_language: str
+    ) -> bool:
+        """
+        Проверка, находится ли пользователь в голосовом канале с ботом
+        
+        Args:
+            inter (disnake.ApplicationCommandInteraction): Объект взаимодействия
+            player (MusicPlayer): Плеер сервера
+            guild_language (str): Код языка сервера
+        
+        Returns:
+            bool: True, если пользователю отправлена ошибка и команду нужно прервать
+        """
+        voice = inter.author.voice
+        if voice and voice.channel == player.channel:
+            return False
+        
+        await inter.response.send_message(self._strings_for(guild_language).not_in_voice, ephemeral=True)
+        return True
+    
+    @staticmethod
+    def _queue_page_size(queue) -> int:
+        """
+        Оценка числа треков на странице очереди по средней длине строки
+        
+        Args:
+            queue (wavelink.Queue): Очередь плеера
+        
+        Returns:
+            int: Количество треков на странице
+        """
+        sample = min(len(queue), QUEUE_PAGE_SAMPLE)
+        if not sample:
+            return QUEUE_PAGE_MIN
+        
+        # +1 за перевод строки
+        total = sum(len(format_queue_entry(i + 1, queue[i])) + 1 for i in range(sample))
+        average = max(total // sample, 1)
+        
+        return max(QUEUE_PAGE_MIN, min(QUEUE_PAGE_MAX, QUEUE_PAGE_BUDGET // average))
+    
+    @staticmethod
+    def _count_humans(channel) -> int:
+        """Подсчет пользователей (не ботов) в голосовом канале"""
+        return sum(1 for m in channel.members if not m.bot)
+    
     async def _get_player(self, inter: disnake.ApplicationCommandInteraction, create: bool = False) -> Optional[MusicPlayer]:
         """
         Получение или создание плеера для сервера
@@ -351,14 +672,70 @@ class Music(commands.Cog):
         # Создание нового плеера
         player = MusicPlayer(client=self.bot, guild_id=guild_id)
         player.bound_channel = inter.channel
-        player.last_activity = datetime.utcnow()
+        player.last_activity = self.bot.loop.time()
         
         # Установка громкости по умолчанию
         await player.set_volume(self.default_volume)
         
         self.players[guild_id] = player
+        
+        # Отключение, если воспроизведение так и не начнется
+        self._schedule_idle_disconnect(player)
         return player
     
+    async def _cached_search(self, query: str) -> List[wavelink.Playable]:
+        """
+        Поиск треков с кратковременным кэшированием результатов
+        
+        Args:
+            query (str): Поисковый запрос или URL
+        
+        Returns:
+            List[wavelink.Playable]: Найденные треки
+        """
+        # Регистр в URL значим (ID видео и плейлистов YouTube), поэтому нормализуется только текстовый поиск
+        key = query.strip()
+        if not URL_DISPATCH_REGEX.match(key):
+            key = key.casefold()
+        now = self.bot.loop.time()
+        
+        cached = self._search_cache.get(key)
+        if cached and now - cached[0] < SEARCH_CACHE_TTL:
+            # Копии, так как play изменяет requested_by у треков
+            return [copy.copy(track) for track in cached[1]]
+        
+        results = await wavelink.Playable.search(query)
+        tracks = list(results) if results else []
+        
+        if tracks:
+            self._search_cache[key] = (now, tracks)
+            self._search_cache.move_to_end(key)
+            
+            # Удаление самых старых записей
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        
+        return [copy.copy(track) for track in tracks]
+    
+    def _strings_for(self, language: str) -> MusicStrings:
+        """
+        Получение локализованных строк для языка
+        
+        Args:
+            language (str): Код языка
+        
+        Returns:
+            MusicStrings: Строки, загруженные один раз на язык
+        """
+        strings = self._strings.get(language)
+        
+        if strings is None:
+            get_template = self.bot.language_manager.get_template
+            strings = MusicStrings._make(get_template(key, language) for key in MUSIC_STRING_KEYS)
+            self._strings[language] = strings
+        
+        return strings
+    
     async def _get_related_track(self, track):
         """
         Получение похожего трека для автоматического воспроизведения
@@ -370,29 +747,52 @@ class Music(commands.Cog):
             wavelink.Playable: Похожий трек или None, если не удалось найти
         """
         try:
-            # Попытка найти похожий трек по YouTube
+            # Поиск по названию и автору используется как запасной вариант
+            fallback_query = f"{track.author} - {track.title}"
+            
+            # Для YouTube запасной поиск запускается заранее и отменяется, если основной дал результат
             if track.uri and YOUTUBE_REGEX.match(track.uri):
-                # Поиск по автору и названию
+                # Поиск по автору
                 search_query = f"{track.author} music"
+                fallback_task = asyncio.create_task(wavelink.Playable.search(fallback_query))
+                # Результат забирается всегда: отменённый или брошенный поиск не должен оставлять
+                # "Task exception was never retrieved"
+                fallback_task.add_done_callback(lambda task: task.cancelled() or task.exception())
                 
-                search_results = await wavelink.Playable.search(search_query)
-                
-                if not search_results:
-                    return None
-                
-                # Исключение текущего трека и выбор случайного из результатов
-                filtered_results = [t for t in search_results if t.uri != track.uri]
+                try:
+                    search_results = await wavelink.Playable.search(search_query)
+                except asyncio.CancelledError:
+                    fallback_task.cancel()
+                    raise
+                except Exception as e:
+                    logger.error(f"Ошибка при поиске похожего трека: {e}")
+                else:
+                    if not search_results:
+                        fallback_task.cancel()
+                        return None
+                    
+                    # Выбор случайного трека, кроме текущего, за один проход
+                    pick = None
+                    count = 0
+                    rand = random.random
+                    
+                    for result in search_results:
+                        if result.uri == track.uri:
+                            continue
+                        count += 1
+                        if rand() * count < 1:
+                            pick = result
+                    
+                    if pick:
+                        fallback_task.cancel()
+                        return pick
                 
-                if filtered_results:
-                    return random.choice(filtered_results)
-            
-            # Если не удалось найти по YouTube, поиск по названию и автору
-            search_query = f"{track.author} - {track.title}"
-            
-            search_results = await wavelink.Playable.search(search_query)
+                fallback_results = await fallback_task
+            else:
+                fallback_results = await wavelink.Playable.search(fallback_query)
             
-            if search_results:
-                return search_results[0]
+            if fallback_results:
+                return fallback_results[0]
             
             return None
             
@@ -400,25 +800,6 @@ class Music(commands.Cog):
             logger.error(f"Ошибка при поиске похожего трека: {e}")
             return None
     
-    def _format_duration(self, ms: int) -> str:
-        """
-        Форматирование продолжительности в формат ЧЧ:ММ:СС
-        
-        Args:
-            ms (int): Продолжительность в миллисекундах
-        
-        Returns:
-            str: Отформатированная продолжительность
-        """
-        seconds = ms // 1000
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        
-        if hours:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes:02d}:{seconds:02d}"
-    
     # ===== Команды для воспроизведения музыки =====
     
     @commands.slash_command(name="play", description="Воспроизвести музыку")
@@ -428,10 +809,15 @@ class Music(commands.Cog):
         query: str = commands.Param(description="Название трека, URL YouTube, Spotify, SoundCloud и т.д.")
     ):
         """Воспроизвести музыку"""
+        author = inter.author
+        voice_state = author.voice
+        guild_id = inter.guild.id
+        language_manager = self.bot.language_manager
+        
         # Проверка, находится ли пользователь в голосовом канале
-        if not inter.author.voice:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_in_voice_text = self.bot.language_manager.get_text("music.play.not_in_voice", guild_language)
+        if not voice_state:
+            guild_language = await self.bot.get_guild_language(guild_id)
+            not_in_voice_text = self._strings_for(guild_language).not_in_voice
             return await inter.response.send_message(not_in_voice_text, ephemeral=True)
         
         # Отложенный ответ, так как поиск может занять время
@@ -440,16 +826,20 @@ class Music(commands.Cog):
         # Получение или создание плеера
         player = await self._get_player(inter, create=True)
         
+        # Язык и строки нужны почти во всех ветках ниже
+        guild_language = await self.bot.get_guild_language(guild_id)
+        strings = self._strings_for(guild_language)
+        
         # Подключение к голосовому каналу, если еще не подключен
         if not player.channel:
             try:
-                await player.connect(inter.author.voice.channel)
-                logger.info(f"Подключен к голосовому каналу {inter.author.voice.channel.id} на сервере {inter.guild.id}")
+                await player.connect(voice_state.channel)
+                player.human_count = self._count_humans(voice_state.channel)
+                logger.info(f"Подключен к голосовому каналу {voice_state.channel.id} на сервере {guild_id}")
             except Exception as e:
                 logger.error(f"Ошибка при подключении к голосовому каналу: {e}")
                 
-                guild_language = await self.bot.get_guild_language(inter.guild.id)
-                error_text = self.bot.language_manager.get_text(
+                error_text = language_manager.get_text(
                     "music.play.error", 
                     guild_language,
                     error=str(e)
@@ -457,94 +847,69 @@ class Music(commands.Cog):
                 return await inter.followup.send(error_text)
         
         # Обновление времени активности
-        player.last_activity = datetime.utcnow()
+        player.last_activity = self.bot.loop.time()
         
         # Обновление привязанного текстового канала
         player.bound_channel = inter.channel
         
         # Поиск и добавление треков в очередь
         try:
-            # Проверка, является ли запрос URL
-            if query.startswith(("http://", "https://")):
-                # Проверка на Spotify URL
-                spotify_match = SPOTIFY_REGEX.match(query)
-                if spotify_match and (self.spotify_client_id and self.spotify_client_secret):
-                    # Получение треков из Spotify
-                    search_type = spotify_match.group("type")
-                    spotify_id = spotify_match.group("id")
-                    
-                    # Логика для обработки Spotify URL будет добавлена позже
-                    
-                    guild_language = await self.bot.get_guild_language(inter.guild.id)
-                    not_supported_text = self.bot.language_manager.get_text("music.play.spotify_not_supported", guild_language)
-                    return await inter.followup.send(not_supported_text)
+            # Определение типа запроса
+            url_match = URL_DISPATCH_REGEX.match(query)
+            url_type = url_match.lastgroup if url_match else None
+            
+            # Проверка на Spotify URL
+            if url_type == "spotify" and (self.spotify_client_id and self.spotify_client_secret):
+                # Получение треков из Spotify
+                search_type = url_match.group("type")
+                spotify_id = url_match.group("id")
                 
-                # Проверка на YouTube плейлист
-                elif YOUTUBE_PLAYLIST_REGEX.match(query):
-                    # Получение треков из YouTube плейлиста
-                    playlist = await wavelink.Playable.search(query)
-                    
-                    if not playlist:
-                        guild_language = await self.bot.get_guild_language(inter.guild.id)
-                        no_results_text = self.bot.language_manager.get_text(
-                            "music.play.no_results", 
-                            guild_language,
-                            query=query
-                        )
-                        return await inter.followup.send(no_results_text)
-                    
-                    # Добавление треков в очередь
-                    tracks_added = 0
-                    
-                    for track in playlist:
-                        # Установка атрибута requested_by
-                        track.requested_by = inter.author
-                        
-                        # Добавление трека в очередь
-                        await player.queue.put_wait(track)
-                        tracks_added += 1
-                    
-                    # Начало воспроизведения, если еще не играет
-                    if not player.is_playing():
-                        await player.play(await player.queue.get_wait())
-                    
-                    # Отправка сообщения об успешном добавлении плейлиста
-                    guild_language = await self.bot.get_guild_language(inter.guild.id)
-                    
-                    embed = disnake.Embed(
-                        title=self.bot.language_manager.get_text("music.playlist.title", guild_language),
-                        description=self.bot.language_manager.get_text(
-                            "music.playlist.description", 
-                            guild_language,
-                            name=query,
-                            count=tracks_added
-                        ),
-                        color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+                # Логика для обработки Spotify URL будет добавлена позже
+                
+                not_supported_text = language_manager.get_text("music.play.spotify_not_supported", guild_language)
+                return await inter.followup.send(not_supported_text)
+            
+            # Проверка на YouTube плейлист
+            elif url_type == "playlist":
+                # Получение треков из YouTube плейлиста
+                playlist = await self._cached_search(query)
+                
+                if not playlist:
+                    no_results_text = language_manager.get_text(
+                        "music.play.no_results", 
+                        guild_language,
+                        query=query
                     )
-                    
-                    return await inter.followup.send(embed=embed)
+                    return await inter.followup.send(no_results_text)
                 
-                else:
-                    # Обычный URL (YouTube, SoundCloud и т.д.)
-                    tracks = await wavelink.Playable.search(query)
-                    
-                    if not tracks:
-                        guild_language = await self.bot.get_guild_language(inter.guild.id)
-                        no_results_text = self.bot.language_manager.get_text(
-                            "music.play.no_results", 
-                            guild_language,
-                            query=query
-                        )
-                        return await inter.followup.send(no_results_text)
-                    
-                    track = tracks[0]
+                # Установка атрибута requested_by
+                for track in playlist:
+                    track.requested_by = author
+                
+                # Добавление всех треков в очередь одним вызовом
+                tracks_added = player.queue.put(playlist)
+                
+                # Начало воспроизведения, если еще не играет
+                if not player.is_playing():
+                    await player.play(await player.queue.get_wait())
+                
+                # Отправка сообщения об успешном добавлении плейлиста
+                embed = self._template_embed(guild_language, "music.playlist.title", 'success')
+                embed.description = language_manager.get_text(
+                    "music.playlist.description", 
+                    guild_language,
+                    name=query,
+                    count=tracks_added
+                )
+                
+                return await inter.followup.send(embed=embed)
+            
             else:
-                # Обычный поиск
-                tracks = await wavelink.Playable.search(query)
+                # Обычный URL (YouTube, SoundCloud и т.д.) или поиск
+                tracks = await self._cached_search(query)
                 
                 if not tracks:
-                    guild_language = await self.bot.get_guild_language(inter.guild.id)
-                    no_results_text = self.bot.language_manager.get_text(
+                    no_results_text = language_manager.get_text(
                         "music.play.no_results", 
                         guild_language,
                         query=query
@@ -554,7 +919,7 @@ class Music(commands.Cog):
                 track = tracks[0]
             
             # Установка атрибута requested_by
-            track.requested_by = inter.author
+            track.requested_by = author
             
             # Добавление трека в очередь
             if player.is_playing():
@@ -563,40 +928,39 @@ class Music(commands.Cog):
                 await player.queue.put_wait(track)
                 
                 # Отправка сообщения об успешном добавлении трека в очередь
-                guild_language = await self.bot.get_guild_language(inter.guild.id)
-                
                 embed = disnake.Embed(
-                    title=self.bot.language_manager.get_text("music.play.title", guild_language),
-                    description=self.bot.language_manager.get_text(
+                    title=language_manager.get_text("music.play.title", guild_language),
+                    description=language_manager.get_text(
                         "music.play.description", 
                         guild_language,
                         title=track.title
                     ),
-                    color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+                    color=self._colors['success']
                 )
                 
                 embed.add_field(
-                    name=self.bot.language_manager.get_text("music.play.duration", guild_language),
-                    value=self._format_duration(track.length),
+                    name=strings.duration,
+                    value=format_duration(track.length),
                     inline=True
                 )
                 
                 embed.add_field(
-                    name=self.bot.language_manager.get_text("music.play.position", guild_language),
+                    name=strings.position,
                     value=str(position),
                     inline=True
                 )
                 
                 if track.uri:
                     embed.add_field(
-                        name=self.bot.language_manager.get_text("music.play.source", guild_language),
-                        value=f"[{self.bot.language_manager.get_text('music.play.link', guild_language)}]({track.uri})",
+                        name=strings.source,
+                        value=f"[{strings.link}]({track.uri})",
                         inline=True
                     )
                 
                 # Добавление обложки трека, если доступна
-                if hasattr(track, 'artwork') and track.artwork:
-                    embed.set_thumbnail(url=track.artwork)
+                artwork = getattr(track, 'artwork', None)
+                if artwork:
+                    embed.set_thumbnail(url=artwork)
                 
                 await inter.followup.send(embed=embed)
             else:
@@ -609,8 +973,7 @@ class Music(commands.Cog):
         except Exception as e:
             logger.error(f"Ошибка при добавлении трека: {e}")
             
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            error_text = self.bot.language_manager.get_text(
+            error_text = language_manager.get_text(
                 "music.play.error", 
                 guild_language,
                 error=str(e)
@@ -618,27 +981,30 @@ class Music(commands.Cog):
             await inter.followup.send(error_text)
     
     @commands.slash_command(name="skip", description="Пропустить текущий трек")
+    @commands.cooldown(COMMAND_RATE, COMMAND_PER, commands.BucketType.user)
     async def skip(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         force: bool = commands.Param(False, description="Принудительно пропустить трек без голосования")
     ):
         """Пропустить текущий трек"""
+        get_text = self.bot.language_manager.get_text
+        
+        # Получение языка сервера
+        guild_language = await self.bot.get_guild_language(inter.guild.id)
+        
         player = await self._get_player(inter)
         
         if not player or not player.is_playing():
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_playing_text = self.bot.language_manager.get_text("music.skip.no_tracks", guild_language)
+            not_playing_text = get_text("music.skip.no_tracks", guild_language)
             return await inter.response.send_message(not_playing_text, ephemeral=True)
         
         # Проверка, находится ли пользователь в голосовом канале с ботом
-        if not inter.author.voice or inter.author.voice.channel != player.channel:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_in_voice_text = self.bot.language_manager.get_text("music.play.not_in_voice", guild_language)
-            return await inter.response.send_message(not_in_voice_text, ephemeral=True)
+        if await self._reject_not_in_voice(inter, player, guild_language):
+            return
         
         # Обновление времени активности
-        player.last_activity = datetime.utcnow()
+        player.last_activity = self.bot.loop.time()
         
         # Получение прав пользователя
         is_dj = (
@@ -647,11 +1013,8 @@ class Music(commands.Cog):
         )
         
         # Проверка, является ли пользователь запросившим трек
-        is_requester = (
-            hasattr(player.current, 'requested_by') and 
-            player.current.requested_by and 
-            player.current.requested_by.id == inter.author.id
-        )
+        requester = getattr(player.current, 'requested_by', None)
+        is_requester = requester is not None and requester.id == inter.author.id
         
         # Проверка, нужно ли голосование
         if is_dj or is_requester or force:
@@ -660,22 +1023,25 @@ class Music(commands.Cog):
             
             await player.skip()
             
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            
-            embed = disnake.Embed(
-                title=self.bot.language_manager.get_text("music.skip.title", guild_language),
-                description=self.bot.language_manager.get_text(
-                    "music.skip.description", 
-                    guild_language,
-                    title=current_track.title if current_track else "Unknown"
-                ),
-                color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+            embed = self._template_embed(guild_language, "music.skip.title", 'success')
+            embed.description = get_text(
+                "music.skip.description", 
+                guild_language,
+                title=current_track.title if current_track else "Unknown"
             )
             
             return await inter.response.send_message(embed=embed)
         
         # Голосование за пропуск
-        required_votes = len([m for m in player.channel.members if not m.bot]) // 2 + 1
+        required_votes = (player.human_count >> 1) + 1
+        
+        # Повторный голос ничего не меняет
+        if inter.author.id in player.skip_votes:
+            already_voted_text = self._strings_for(guild_language).already_voted.format(
+                votes=len(player.skip_votes),
+                required=required_votes
+            )
+            return await inter.response.send_message(already_voted_text, ephemeral=True)
         
         # Добавление голоса
         player.skip_votes.add(inter.author.id)
@@ -687,275 +1053,235 @@ class Music(commands.Cog):
             
             await player.skip()
             
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            
-            embed = disnake.Embed(
-                title=self.bot.language_manager.get_text("music.skip.title", guild_language),
-                description=self.bot.language_manager.get_text(
-                    "music.skip.description", 
-                    guild_language,
-                    title=current_track.title if current_track else "Unknown"
-                ),
-                color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+            embed = self._template_embed(guild_language, "music.skip.title", 'success')
+            embed.description = get_text(
+                "music.skip.description", 
+                guild_language,
+                title=current_track.title if current_track else "Unknown"
             )
             
             return await inter.response.send_message(embed=embed)
         else:
             # Недостаточно голосов
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            
-            embed = disnake.Embed(
-                title=self.bot.language_manager.get_text("music.skip.vote_title", guild_language),
-                description=self.bot.language_manager.get_text(
-                    "music.skip.vote", 
-                    guild_language,
-                    votes=len(player.skip_votes),
-                    required=required_votes
-                ),
-                color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('info', 0x7289da))
+            embed = self._template_embed(guild_language, "music.skip.vote_title", 'info')
+            embed.description = get_text(
+                "music.skip.vote", 
+                guild_language,
+                votes=len(player.skip_votes),
+                required=required_votes
             )
             
             return await inter.response.send_message(embed=embed)
     
     @commands.slash_command(name="queue", description="Показать очередь воспроизведения")
+    @commands.cooldown(COMMAND_RATE, COMMAND_PER, commands.BucketType.user)
     async def queue(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         page: int = commands.Param(1, description="Номер страницы", ge=1)
     ):
         """Показать очередь воспроизведения"""
+        get_text = self.bot.language_manager.get_text
+        
         player = await self._get_player(inter)
         
         if not player:
             guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_playing_text = self.bot.language_manager.get_text("music.queue.empty", guild_language)
+            not_playing_text = get_text("music.queue.empty", guild_language)
             return await inter.response.send_message(not_playing_text, ephemeral=True)
         
-        # Обновление времени активности
-        player.last_activity = datetime.utcnow()
+        # Отложенный ответ: сборка страницы и поиск языка не должны упираться в лимит в 3 секунды
+        await inter.response.defer()
         
         # Получение языка сервера
         guild_language = await self.bot.get_guild_language(inter.guild.id)
         
+        # Обновление времени активности
+        player.last_activity = self.bot.loop.time()
+        
+        queue_length = len(player.queue)
+        current = player.current
+        
+        # Пустая очередь без текущего трека: только заголовок и описание
+        if not queue_length and not current:
+            embed = self._template_embed(guild_language, "music.queue.title", 'info')
+            embed.description = get_text("music.queue.empty", guild_language)
+            return await inter.followup.send(embed=embed)
+        
+        # Пагинация очереди
+        queue = player.queue
+        items_per_page = self._queue_page_size(queue)
+        pages = max((queue_length + items_per_page - 1) // items_per_page, 1)
+        
+        if page > pages:
+            page = pages
+        
+        # Получение всех строк команды за один вызов
+        texts = self.bot.language_manager.get_texts(
+            (
+                "music.queue.title",
+                "music.queue.now_playing",
+                "music.queue.empty",
+                "music.queue.page",
+                "music.queue.description",
+                "music.queue.total",
+            ),
+            guild_language,
+            title=current.title if current else "",
+            duration=format_duration(current.length) if current else "",
+            page=page,
+            total_pages=pages,
+            count=queue_length
+        )
+        
         # Создание эмбеда для очереди
         embed = disnake.Embed(
-            title=self.bot.language_manager.get_text("music.queue.title", guild_language),
-            color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('info', 0x7289da))
+            title=texts["music.queue.title"],
+            color=self._colors['info']
         )
         
         # Добавление информации о текущем треке
-        if player.current:
+        if current:
             embed.add_field(
-                name=self.bot.language_manager.get_text(
-                    "music.queue.now_playing", 
-                    guild_language,
-                    title=player.current.title,
-                    duration=self._format_duration(player.current.length)
-                ),
-                value=f"**{player.current.author}**",
+                name=texts["music.queue.now_playing"],
+                value=f"**{current.author}**",
                 inline=False
             )
         
         # Проверка, есть ли треки в очереди
-        if not player.queue:
-            embed.description = self.bot.language_manager.get_text("music.queue.empty", guild_language)
-            return await inter.response.send_message(embed=embed)
-        
-        # Пагинация очереди
-        items_per_page = 10
-        pages = (len(player.queue) + items_per_page - 1) // items_per_page
-        
-        if page > pages:
-            page = pages
+        if not queue_length:
+            embed.description = texts["music.queue.empty"]
+            return await inter.followup.send(embed=embed)
         
         start = (page - 1) * items_per_page
-        end = min(start + items_per_page, len(player.queue))
+        end = min(start + items_per_page, queue_length)
         
-        # Формирование списка треков
-        queue_list = []
-        for i, track in enumerate(list(player.queue)[start:end], start=start+1):
-            requester = f" ({track.requested_by})" if hasattr(track, 'requested_by') and track.requested_by else ""
-            queue_list.append(f"**{i}.** {track.title} - {track.author} [{self._format_duration(track.length)}]{requester}")
+        # Строки длиннее доли страницы обрезаются, поэтому полная страница помещается в описание
+        # (-1 за перевод строки)
+        entry_limit = EMBED_DESCRIPTION_LIMIT // items_per_page - 1
         
-        # Добавление списка треков в эмбед
-        embed.description = "\n".join(queue_list)
+        # Треки страницы по индексу: без прохода по предыдущим страницам
+        embed.description = "\n".join(
+            format_queue_entry(i + 1, queue[i], entry_limit) for i in range(start, end)
+        )
         
         # Добавление информации о количестве треков и страницах
-        embed.set_footer(text=self.bot.language_manager.get_text(
-            "music.queue.page", 
-            guild_language,
-            page=page,
-            total_pages=pages
-        ))
+        embed.set_footer(text=texts["music.queue.page"])
         
         embed.add_field(
-            name=self.bot.language_manager.get_text("music.queue.description", guild_language),
-            value=self.bot.language_manager.get_text(
-                "music.queue.total", 
-                guild_language,
-                count=len(player.queue)
-            ),
+            name=texts["music.queue.description"],
+            value=texts["music.queue.total"],
             inline=False
         )
         
-        await inter.response.send_message(embed=embed)
+        await inter.followup.send(embed=embed)
     
-    @commands.slash_command(name="stop", description="Остановить воспроизведение и очистить очередь")
-    async def stop(self, inter: disnake.ApplicationCommandInteraction):
-        """Остановить воспроизведение и очистить очередь"""
+    async def _run_player_command(
+        self,
+        inter: disnake.ApplicationCommandInteraction,
+        command: str,
+        is_active: Callable[[MusicPlayer], bool],
+        action: Callable[[MusicPlayer], Awaitable[Any]],
+        blocked: Optional[Tuple[Callable[[MusicPlayer], bool], str]] = None,
+        **kwargs
+    ):
+        """
+        Общий сценарий команд управления плеером: проверки, действие и ответ
+        
+        Args:
+            inter (disnake.ApplicationCommandInteraction): Объект взаимодействия
+            command (str): Раздел языкового файла (music.<command>.*)
+            is_active (Callable): Условие, при котором команда применима, иначе music.<command>.not_playing
+            action (Callable): Действие над плеером
+            blocked (Tuple[Callable, str], optional): Условие отказа и ключ текста ошибки
+            **kwargs: Параметры для форматирования описания
+        """
+        get_text = self.bot.language_manager.get_text
+        
+        # Получение языка сервера
+        guild_language = await self.bot.get_guild_language(inter.guild.id)
+        
         player = await self._get_player(inter)
         
-        if not player or not player.is_playing():
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_playing_text = self.bot.language_manager.get_text("music.stop.not_playing", guild_language)
+        if not player or not is_active(player):
+            not_playing_text = get_text(f"music.{command}.not_playing", guild_language)
             return await inter.response.send_message(not_playing_text, ephemeral=True)
         
         # Проверка, находится ли пользователь в голосовом канале с ботом
-        if not inter.author.voice or inter.author.voice.channel != player.channel:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_in_voice_text = self.bot.language_manager.get_text("music.play.not_in_voice", guild_language)
-            return await inter.response.send_message(not_in_voice_text, ephemeral=True)
+        if await self._reject_not_in_voice(inter, player, guild_language):
+            return
         
-        # Очистка очереди и остановка воспроизведения
-        player.queue.clear()
-        await player.stop()
-        player.current = None
+        # Проверка состояния плеера
+        if blocked and blocked[0](player):
+            return await inter.response.send_message(get_text(blocked[1], guild_language), ephemeral=True)
         
-        # Обновление времени активности
-        player.last_activity = datetime.utcnow()
+        await action(player)
         
-        # Отправка сообщения об успешной остановке
-        guild_language = await self.bot.get_guild_language(inter.guild.id)
+        # Обновление времени активности
+        player.last_activity = self.bot.loop.time()
         
-        embed = disnake.Embed(
-            title=self.bot.language_manager.get_text("music.stop.title", guild_language),
-            description=self.bot.language_manager.get_text("music.stop.description", guild_language),
-            color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
-        )
+        # Отправка сообщения об успешном выполнении
+        embed = self._template_embed(guild_language, f"music.{command}.title", 'success')
+        embed.description = get_text(f"music.{command}.description", guild_language, **kwargs)
         
         await inter.response.send_message(embed=embed)
     
+    @staticmethod
+    async def _stop_player(player: MusicPlayer):
+        """Очистка очереди и остановка воспроизведения"""
+        player.queue.clear()
+        await player.stop()
+        player.current = None
+    
+    @staticmethod
+    async def _resume_player(player: MusicPlayer):
+        """Возобновление воспроизведения"""
+        await player.resume()
+        
+        # Сброс флага waiting (если он был установлен из-за пустого голосового канала)
+        player.waiting = False
+    
+    @commands.slash_command(name="stop", description="Остановить воспроизведение и очистить очередь")
+    async def stop(self, inter: disnake.ApplicationCommandInteraction):
+        """Остановить воспроизведение и очистить очередь"""
+        await self._run_player_command(inter, "stop", MusicPlayer.is_playing, self._stop_player)
+    
     @commands.slash_command(name="volume", description="Установить громкость воспроизведения")
+    @commands.cooldown(COMMAND_RATE, COMMAND_PER, commands.BucketType.user)
     async def volume(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         volume: int = commands.Param(description="Громкость (0-100)", ge=0, le=100)
     ):
         """Установить громкость воспроизведения"""
-        player = await self._get_player(inter)
-        
-        if not player:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_playing_text = self.bot.language_manager.get_text("music.volume.not_playing", guild_language)
-            return await inter.response.send_message(not_playing_text, ephemeral=True)
-        
-        # Проверка, находится ли пользователь в голосовом канале с ботом
-        if not inter.author.voice or inter.author.voice.channel != player.channel:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_in_voice_text = self.bot.language_manager.get_text("music.play.not_in_voice", guild_language)
-            return await inter.response.send_message(not_in_voice_text, ephemeral=True)
-        
-        # Установка громкости
-        await player.set_volume(volume)
-        
-        # Обновление времени активности
-        player.last_activity = datetime.utcnow()
-        
-        # Отправка сообщения об успешной установке громкости
-        guild_language = await self.bot.get_guild_language(inter.guild.id)
-        
-        embed = disnake.Embed(
-            title=self.bot.language_manager.get_text("music.volume.title", guild_language),
-            description=self.bot.language_manager.get_text(
-                "music.volume.description", 
-                guild_language,
-                volume=volume
-            ),
-            color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+        await self._run_player_command(
+            inter, "volume",
+            lambda player: True,
+            lambda player: player.set_volume(volume),
+            volume=volume
         )
-        
-        await inter.response.send_message(embed=embed)
     
     @commands.slash_command(name="pause", description="Приостановить воспроизведение")
+    @commands.cooldown(COMMAND_RATE, COMMAND_PER, commands.BucketType.user)
     async def pause(self, inter: disnake.ApplicationCommandInteraction):
         """Приостановить воспроизведение"""
-        player = await self._get_player(inter)
-        
-        if not player or not player.is_playing():
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_playing_text = self.bot.language_manager.get_text("music.pause.not_playing", guild_language)
-            return await inter.response.send_message(not_playing_text, ephemeral=True)
-        
-        # Проверка, находится ли пользователь в голосовом канале с ботом
-        if not inter.author.voice or inter.author.voice.channel != player.channel:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_in_voice_text = self.bot.language_manager.get_text("music.play.not_in_voice", guild_language)
-            return await inter.response.send_message(not_in_voice_text, ephemeral=True)
-        
-        # Проверка, что воспроизведение не приостановлено
-        if player.is_paused():
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            already_paused_text = self.bot.language_manager.get_text("music.pause.already_paused", guild_language)
-            return await inter.response.send_message(already_paused_text, ephemeral=True)
-        
-        # Приостановка воспроизведения
-        await player.pause()
-        
-        # Обновление времени активности
-        player.last_activity = datetime.utcnow()
-        
-        # Отправка сообщения об успешной приостановке
-        guild_language = await self.bot.get_guild_language(inter.guild.id)
-        
-        embed = disnake.Embed(
-            title=self.bot.language_manager.get_text("music.pause.title", guild_language),
-            description=self.bot.language_manager.get_text("music.pause.description", guild_language),
-            color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+        await self._run_player_command(
+            inter, "pause",
+            MusicPlayer.is_playing,
+            MusicPlayer.pause,
+            blocked=(MusicPlayer.is_paused, "music.pause.already_paused")
         )
-        
-        await inter.response.send_message(embed=embed)
     
     @commands.slash_command(name="resume", description="Возобновить воспроизведение")
+    @commands.cooldown(COMMAND_RATE, COMMAND_PER, commands.BucketType.user)
     async def resume(self, inter: disnake.ApplicationCommandInteraction):
         """Возобновить воспроизведение"""
-        player = await self._get_player(inter)
-        
-        if not player or not player.current:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_playing_text = self.bot.language_manager.get_text("music.resume.not_playing", guild_language)
-            return await inter.response.send_message(not_playing_text, ephemeral=True)
-        
-        # Проверка, находится ли пользователь в голосовом канале с ботом
-        if not inter.author.voice or inter.author.voice.channel != player.channel:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_in_voice_text = self.bot.language_manager.get_text("music.play.not_in_voice", guild_language)
-            return await inter.response.send_message(not_in_voice_text, ephemeral=True)
-        
-        # Проверка, что воспроизведение приостановлено
-        if not player.is_paused():
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
-            not_paused_text = self.bot.language_manager.get_text("music.resume.not_paused", guild_language)
-            return await inter.response.send_message(not_paused_text, ephemeral=True)
-        
-        # Возобновление воспроизведения
-        await player.resume()
-        
-        # Сброс флага waiting (если он был установлен из-за пустого голосового канала)
-        player.waiting = False
-        
-        # Обновление времени активности
-        player.last_activity = datetime.utcnow()
-        
-        # Отправка сообщения об успешном возобновлении
-        guild_language = await self.bot.get_guild_language(inter.guild.id)
-        
-        embed = disnake.Embed(
-            title=self.bot.language_manager.get_text("music.resume.title", guild_language),
-            description=self.bot.language_manager.get_text("music.resume.description", guild_language),
-            color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('success', 0x2ecc71))
+        await self._run_player_command(
+            inter, "resume",
+            lambda player: bool(player.current),
+            self._resume_player,
+            blocked=(lambda player: not player.is_paused(), "music.resume.not_paused")
         )
-        
-        await inter.response.send_message(embed=embed)
 
 # Setup function for the cog
 def setup(bot):
@@ -7,22 +7,118 @@ Includes user info, server info, weather, reminder, and other utility functions.
 """
 
 import disnake
-from disnake.ext import commands, tasks
+from disnake.ext import commands
 import asyncio
 import datetime
+import heapq
+import itertools
 import time
 import pytz
 import re
 import random
 import logging
+import math
+from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import Optional
+from sqlalchemy import delete, insert, update
 from sqlalchemy.future import select
 
 from bot.utils.embed_creator import create_embed
 from bot.utils.localization import _
 from bot.utils.db_manager import get_session, get_guild_language
 from bot.utils.api_wrapper import get_api
-from bot.models import Guild, Member, CommandUsage
+from bot.models import Guild, Member, CommandUsage, Reminder, Poll
+
+UTC = datetime.timezone.utc
+
+# Reminder durations like 10m, 1h, 2d
+_TIME_RE = re.compile(r"(\d+)([smhdw])")
+# Unit suffix -> (translation key, seconds per unit)
+_UNITS = {
+    's': ("{amount} seconds", 1),
+    'm': ("{amount} minutes", 60),
+    'h': ("{amount} hours", 3600),
+    'd': ("{amount} days", 86400),
+    'w': ("{amount} weeks", 604800),
+}
+
+# Command usage rows are written in batches of this size, or every interval seconds
+USAGE_FLUSH_SIZE = 200
+USAGE_FLUSH_INTERVAL = 5
+
+# Download links offered by /avatar
+_AVATAR_FORMATS = ('png', 'jpg', 'webp')
+_ANIMATED_AVATAR_FORMATS = _AVATAR_FORMATS + ('gif',)
+
+@lru_cache(maxsize=256)
+def _feature_label(feature):
+    """Turn a guild feature flag like ANIMATED_ICON into 'Animated Icon'"""
+    return feature.replace('_', ' ').title()
+
+# /random thumbnails and dice faces
+_COIN_THUMBNAIL = "https://emojipedia-us.s3.dualstack.us-west-1.amazonaws.com/thumbs/120/twitter/322/coin_1fa99.png"
+_EIGHT_BALL_THUMBNAIL = "https://emojipedia-us.s3.dualstack.us-west-1.amazonaws.com/thumbs/120/twitter/322/pool-8-ball_1f3b1.png"
+_DICE_EMOJIS = ("⚀", "⚁", "⚂", "⚃", "⚄", "⚅")
+
+# /random card deck and Magic 8-Ball answers, translated only once drawn
+_CARD_SUITS = ("Hearts", "Diamonds", "Clubs", "Spades")
+_RED_SUITS = frozenset(("Hearts", "Diamonds"))
+_CARD_VALUES = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace")
+_EIGHT_BALL_ANSWERS = (
+    # Positive answers
+    "It is certain.",
+    "It is decidedly so.",
+    "Without a doubt.",
+    "Yes - definitely.",
+    "You may rely on it.",
+    "As I see it, yes.",
+    "Most likely.",
+    "Outlook good.",
+    "Yes.",
+    "Signs point to yes.",
+    
+    # Neutral answers
+    "Reply hazy, try again.",
+    "Ask again later.",
+    "Better not tell you now.",
+    "Cannot predict now.",
+    "Concentrate and ask again.",
+    
+    # Negative answers
+    "Don't count on it.",
+    "My reply is no.",
+    "My sources say no.",
+    "Outlook not so good.",
+    "Very doubtful.",
+)
+
+# Error descriptions for failed OpenWeatherMap calls, and their rendered embeds per (endpoint, lang)
+_FETCH_ERRORS = {
+    'weather': "Could not fetch weather information. Please check the location and try again.",
+    'forecast': "Could not fetch forecast information. Please check the location and try again.",
+}
+_FETCH_ERROR_EMBEDS = {}
+
+def _fetch_error_embed(endpoint, lang):
+    """Build the error embed for a failed weather/forecast call from a cached dict"""
+    key = (endpoint, lang)
+    data = _FETCH_ERROR_EMBEDS.get(key)
+    if data is None:
+        data = create_embed(
+            title=_("Error", lang),
+            description=_(_FETCH_ERRORS[endpoint], lang),
+            color=disnake.Color.red(),
+            timestamp=False
+        ).to_dict()
+        _FETCH_ERROR_EMBEDS[key] = data
+    
+    embed = disnake.Embed.from_dict(data)
+    embed.timestamp = datetime.datetime.now(UTC)
+    return embed
+
+# Poll option markers, also used as the vote reactions
+_EMOJI_NUMBERS = ('1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟')
 
 class Utility(commands.Cog):
     """Utility commands for server and user information"""
@@ -30,72 +126,259 @@ class Utility(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('bot.utility')
+        # Min-heap of (due_time, seq, reminder); seq keeps equal due times ordered
         self.reminders = []
-        self.reminder_task.start()
+        self._reminder_seq = itertools.count()
+        self._reminder_wake = asyncio.Event()
+        self._reminder_task = None
+        # guild_id -> number of bot members, primed lazily and kept up to date by member events
+        self._bot_counts = {}
+        # Pending CommandUsage rows, flushed by usage_task
+        self._usage_buffer = []
+        self._usage_flush = asyncio.Event()
+        self._usage_task = None
+        # message_id -> {'id', 'votes': [set of voter IDs per option]}; saved by usage_task
+        self.polls = {}
+        self._dirty_polls = set()
+        # Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+        self._bg_tasks = set()
+        # Generator for /random, kept separate from the module-level random state
+        self._rng = random.Random()
+    
+    async def cog_load(self):
+        self._reminder_task = asyncio.create_task(self.reminder_task())
+        self._usage_task = asyncio.create_task(self.usage_task())
+        self.spawn(self.load_polls())
     
     def cog_unload(self):
-        self.reminder_task.cancel()
+        if self._reminder_task:
+            self._reminder_task.cancel()
+        if self._usage_task:
+            self._usage_task.cancel()
+        # Write out whatever is still buffered
+        if self._usage_buffer:
+            self.spawn(self.flush_command_usage())
+        if self._dirty_polls:
+            self.spawn(self.flush_poll_votes())
+    
+    def spawn(self, coro):
+        """Run a coroutine in the background, keeping a reference and logging failures"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+        return task
+    
+    def _on_bg_task_done(self, task):
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            self.logger.error(f"Background task failed: {task.exception()}")
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Member events may have been missed while disconnected
+        self._bot_counts.clear()
+    
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        if member.bot and member.guild.id in self._bot_counts:
+            self._bot_counts[member.guild.id] += 1
+    
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        if member.bot and member.guild.id in self._bot_counts:
+            self._bot_counts[member.guild.id] -= 1
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._bot_counts.pop(guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload):
+        self.update_poll_vote(payload, True)
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload):
+        self.update_poll_vote(payload, False)
+    
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload):
+        poll = self.polls.pop(payload.message_id, None)
+        if poll is None:
+            return
+        
+        self._dirty_polls.discard(payload.message_id)
+        if poll['id'] is None:
+            return
+        
+        try:
+            async with get_session() as session:
+                await session.execute(delete(Poll).where(Poll.id == poll['id']))
+                await session.commit()
+        except Exception as e:
+            self.logger.error(f"Error deleting poll: {e}")
+    
+    def update_poll_vote(self, payload, added):
+        """Apply a reaction change to the in-memory tally of a poll"""
+        poll = self.polls.get(payload.message_id)
+        if poll is None or payload.user_id == self.bot.user.id:
+            return
+        
+        try:
+            index = _EMOJI_NUMBERS.index(str(payload.emoji))
+        except ValueError:
+            return
+        if index >= len(poll['votes']):
+            return
+        
+        if added:
+            poll['votes'][index].add(payload.user_id)
+        else:
+            poll['votes'][index].discard(payload.user_id)
+        self._dirty_polls.add(payload.message_id)
+    
+    def get_bot_count(self, guild):
+        """Return the number of bots in a guild, scanning its members only once"""
+        count = self._bot_counts.get(guild.id)
+        if count is None:
+            count = sum(1 for member in guild.members if member.bot)
+            self._bot_counts[guild.id] = count
+        return count
     
-    @tasks.loop(seconds=30)
     async def reminder_task(self):
-        """Check for reminders that are due"""
-        now = datetime.datetime.utcnow().timestamp()
-        due_reminders = [r for r in self.reminders if r['due_time'] <= now]
+        """Sleep until the next reminder is due and deliver it"""
+        await self.bot.wait_until_ready()
+        await self.load_reminders()
         
-        for reminder in due_reminders:
-            self.reminders.remove(reminder)
+        while True:
+            self._reminder_wake.clear()
+            
+            # Nothing scheduled: wait for remind to add something
+            if not self.reminders:
+                await self._reminder_wake.wait()
+                continue
+            
+            now = datetime.datetime.utcnow().timestamp()
+            delay = self.reminders[0][0] - now
+            
+            # Sleep until the earliest reminder, or until an earlier one is added
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._reminder_wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
             
+            while self.reminders and self.reminders[0][0] <= now:
+                _due, _seq, reminder = heapq.heappop(self.reminders)
+                self.spawn(self.deliver_reminder(reminder))
+    
+    async def deliver_reminder(self, reminder):
+        """Send a due reminder and remove it from the database"""
+        try:
+            # Get the user
+            user = await self.bot.fetch_user(reminder['user_id'])
+            if not user:
+                return
+            
+            # Create embed
+            embed = create_embed(
+                title=_("Reminder", reminder['language']),
+                description=_("You asked me to remind you about:", reminder['language']),
+                color=disnake.Color.blue()
+            )
+            embed.add_field(
+                name=_("Message", reminder['language']),
+                value=reminder['message'],
+                inline=False
+            )
+            embed.add_field(
+                name=_("Set", reminder['language']),
+                value=f"<t:{int(reminder['set_time'])}:R>",
+                inline=True
+            )
+            
+            # Try to send DM
             try:
-                # Get the user
-                user = await self.bot.fetch_user(reminder['user_id'])
-                if not user:
-                    continue
-                
-                # Create embed
-                embed = create_embed(
-                    title=_("Reminder", reminder['language']),
-                    description=_("You asked me to remind you about:", reminder['language']),
-                    color=disnake.Color.blue()
-                )
-                embed.add_field(
-                    name=_("Message", reminder['language']),
-                    value=reminder['message'],
-                    inline=False
-                )
-                embed.add_field(
-                    name=_("Set", reminder['language']),
-                    value=f"<t:{int(reminder['set_time'])}:R>",
-                    inline=True
-                )
+                await user.send(embed=embed)
+            except Exception:
+                # If DM fails, try to send to the original channel
+                if reminder.get('channel_id'):
+                    channel = self.bot.get_channel(reminder['channel_id'])
+                    if channel:
+                        await channel.send(
+                            content=user.mention,
+                            embed=embed
+                        )
+        except Exception as e:
+            self.logger.error(f"Error sending reminder: {e}")
+        finally:
+            await self.delete_reminder(reminder)
+    
+    async def delete_reminder(self, reminder):
+        """Remove a delivered reminder from the database"""
+        if reminder.get('id') is None:
+            return
+        
+        try:
+            async with get_session() as session:
+                await session.execute(delete(Reminder).where(Reminder.id == reminder['id']))
+                await session.commit()
+        except Exception as e:
+            self.logger.error(f"Error deleting reminder: {e}")
+    
+    def schedule_reminder(self, reminder):
+        """Push a reminder onto the due-time heap"""
+        heapq.heappush(self.reminders, (reminder['due_time'], next(self._reminder_seq), reminder))
+        
+        # Wake the reminder task so it can recompute its sleep
+        self._reminder_wake.set()
+    
+    async def load_reminders(self):
+        """Load pending reminders from the database"""
+        try:
+            async with get_session() as session:
+                result = await session.execute(select(Reminder))
                 
-                # Try to send DM
-                try:
-                    await user.send(embed=embed)
-                except Exception:
-                    # If DM fails, try to send to the original channel
-                    if reminder.get('channel_id'):
-                        channel = self.bot.get_channel(reminder['channel_id'])
-                        if channel:
-                            await channel.send(
-                                content=user.mention,
-                                embed=embed
-                            )
-            except Exception as e:
-                self.logger.error(f"Error sending reminder: {e}")
+                for row in result.scalars().all():
+                    self.schedule_reminder({
+                        'id': row.id,
+                        'user_id': row.user_id,
+                        'channel_id': row.channel_id,
+                        'guild_id': row.guild_id,
+                        'message': row.message,
+                        'set_time': row.set_time,
+                        'due_time': row.due_time,
+                        'language': row.language
+                    })
+        except Exception as e:
+            self.logger.error(f"Error loading reminders: {e}")
     
-    @reminder_task.before_loop
-    async def before_reminder_task(self):
+    async def load_polls(self):
+        """Load polls and their votes from the database"""
         await self.bot.wait_until_ready()
+        
+        try:
+            async with get_session() as session:
+                result = await session.execute(select(Poll.id, Poll.message_id, Poll.options, Poll.votes))
+                
+                for poll_id, message_id, options, votes in result.all():
+                    votes = votes or []
+                    self.polls[message_id] = {
+                        'id': poll_id,
+                        'votes': [set(votes[i]) if i < len(votes) else set() for i in range(len(options))]
+                    }
+        except Exception as e:
+            self.logger.error(f"Error loading polls: {e}")
     
     @commands.slash_command(name="ping")
     async def ping(self, interaction: disnake.ApplicationCommandInteraction):
         """Check the bot's latency"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         await interaction.response.defer()
-        end_time = time.time()
+        end_time = time.perf_counter()
         
-        # Get language
-        lang = await get_guild_language(interaction.guild.id if interaction.guild else None)
+        # Get language; DMs always use English
+        lang = await get_guild_language(interaction.guild.id) if interaction.guild else 'en'
         
         # Calculate latencies
         api_latency = (end_time - start_time) * 1000
@@ -168,8 +451,18 @@ class Utility(commands.Cog):
         
         # Add member-specific fields if available
         if member:
-            # Roles (excluding @everyone)
-            roles = [role.mention for role in reversed(member.roles) if role.name != "@everyone"]
+            # Roles (excluding @everyone), highest first, stopping at the field limit
+            role_count = len(member.roles) - 1
+            roles = []
+            length = 0
+            for role in reversed(member.roles):
+                if role.name == "@everyone":
+                    continue
+                length += len(role.mention) + 2
+                if length > 1020:
+                    roles.append("...")
+                    break
+                roles.append(role.mention)
             roles_str = ", ".join(roles) if roles else _("None", lang)
             
             # Add member fields
@@ -184,8 +477,8 @@ class Utility(commands.Cog):
                 inline=False
             )
             embed.add_field(
-                name=_("Roles", lang) + f" [{len(roles)}]",
-                value=roles_str if len(roles_str) <= 1024 else roles_str[:1020] + "...",
+                name=_("Roles", lang) + f" [{role_count}]",
+                value=roles_str,
                 inline=False
             )
         
@@ -196,7 +489,7 @@ class Utility(commands.Cog):
         await interaction.response.send_message(embed=embed)
         
         # Log command usage
-        await self.log_command(interaction.author.id, interaction.guild.id, "userinfo")
+        self.log_command(interaction.author.id, interaction.guild.id, "userinfo")
     
     @commands.slash_command(name="serverinfo")
     @commands.guild_only()
@@ -214,7 +507,7 @@ class Utility(commands.Cog):
         
         # Count members by status
         total_members = guild.member_count
-        bot_count = sum(1 for member in guild.members if member.bot)
+        bot_count = self.get_bot_count(guild)
         human_count = total_members - bot_count
         
         # Create embed
@@ -277,7 +570,7 @@ class Utility(commands.Cog):
         
         # Server features
         if guild.features:
-            feature_list = "\n".join(f"• {feature.replace('_', ' ').title()}" for feature in guild.features)
+            feature_list = "\n".join(f"• {_feature_label(feature)}" for feature in guild.features)
             embed.add_field(
                 name=_("Server Features", lang),
                 value=feature_list[:1024],
@@ -303,7 +596,7 @@ class Utility(commands.Cog):
         await interaction.response.send_message(embed=embed)
         
         # Log command usage
-        await self.log_command(interaction.author.id, interaction.guild.id, "serverinfo")
+        self.log_command(interaction.author.id, interaction.guild.id, "serverinfo")
     
     @commands.slash_command(name="avatar")
     async def avatar(
@@ -331,15 +624,13 @@ class Utility(commands.Cog):
             color=user.accent_color or disnake.Color.blue()
         )
         
-        # Add avatar
-        embed.set_image(url=user.display_avatar.url)
+        # Add avatar (display_avatar builds a new Asset on every access)
+        avatar = user.display_avatar
+        embed.set_image(url=avatar.url)
         
         # Add links for different formats
-        formats = []
-        for fmt in ['png', 'jpg', 'webp']:
-            formats.append(f"[{fmt.upper()}]({user.display_avatar.with_format(fmt).url})")
-        if user.display_avatar.is_animated():
-            formats.append(f"[GIF]({user.display_avatar.with_format('gif').url})")
+        fmts = _ANIMATED_AVATAR_FORMATS if avatar.is_animated() else _AVATAR_FORMATS
+        formats = [f"[{fmt.upper()}]({avatar.with_format(fmt).url})" for fmt in fmts]
         
         embed.add_field(
             name=_("Links", lang),
@@ -352,7 +643,7 @@ class Utility(commands.Cog):
         
         # Log command usage
         if interaction.guild:
-            await self.log_command(interaction.author.id, interaction.guild.id, "avatar")
+            self.log_command(interaction.author.id, interaction.guild.id, "avatar")
     
     @commands.slash_command(name="weather")
     async def weather(
@@ -456,14 +747,12 @@ class Utility(commands.Cog):
                 inline=True
             )
             
-            # Add sunrise/sunset
-            sunrise = datetime.datetime.utcfromtimestamp(weather_data['sys']['sunrise'])
-            sunset = datetime.datetime.utcfromtimestamp(weather_data['sys']['sunset'])
+            # Add sunrise/sunset (already Unix timestamps)
             embed.add_field(
                 name=_("Sunrise/Sunset", lang),
                 value=_("Sunrise: <t:{sunrise}:t>\nSunset: <t:{sunset}:t>", lang).format(
-                    sunrise=int(sunrise.timestamp()),
-                    sunset=int(sunset.timestamp())
+                    sunrise=int(weather_data['sys']['sunrise']),
+                    sunset=int(weather_data['sys']['sunset'])
                 ),
                 inline=False
             )
@@ -477,16 +766,11 @@ class Utility(commands.Cog):
         except Exception as e:
             self.logger.error(f"Error fetching weather: {e}")
             
-            embed = create_embed(
-                title=_("Error", lang),
-                description=_("Could not fetch weather information. Please check the location and try again.", lang),
-                color=disnake.Color.red()
-            )
-            await interaction.edit_original_message(embed=embed)
+            await interaction.edit_original_message(embed=_fetch_error_embed('weather', lang))
         
         # Log command usage
         if interaction.guild:
-            await self.log_command(interaction.author.id, interaction.guild.id, "weather")
+            self.log_command(interaction.author.id, interaction.guild.id, "weather")
     
     @commands.slash_command(name="forecast")
     async def forecast(
@@ -535,31 +819,31 @@ class Utility(commands.Cog):
             )
             
             # Group forecast by day
-            forecasts_by_day = {}
+            forecasts_by_day = defaultdict(list)
             for item in forecast_data['list']:
-                dt = datetime.datetime.utcfromtimestamp(item['dt'])
-                day_key = dt.strftime("%Y-%m-%d")
-                
-                if day_key not in forecasts_by_day:
-                    forecasts_by_day[day_key] = []
-                
+                day_key = datetime.datetime.fromtimestamp(item['dt'], tz=UTC).date()
                 forecasts_by_day[day_key].append(item)
             
             # Create summary for each day
             for day, forecasts in list(forecasts_by_day.items())[:5]:  # Limit to 5 days
-                dt = datetime.datetime.strptime(day, "%Y-%m-%d")
-                day_name = dt.strftime("%A")
+                day_name = day.strftime("%A")
                 
-                # Calculate average temperature and collect weather descriptions
-                temps = [f['main']['temp'] for f in forecasts]
-                avg_temp = sum(temps) / len(temps)
-                min_temp = min(f['main']['temp_min'] for f in forecasts)
-                max_temp = max(f['main']['temp_max'] for f in forecasts)
-                descriptions = [f['weather'][0]['description'] for f in forecasts]
-                main_desc = max(set(descriptions), key=descriptions.count)
+                # Temperatures and weather descriptions in a single pass
+                total_temp = 0.0
+                min_temp = math.inf
+                max_temp = -math.inf
+                descriptions = Counter()
+                for f in forecasts:
+                    main = f['main']
+                    total_temp += main['temp']
+                    if main['temp_min'] < min_temp:
+                        min_temp = main['temp_min']
+                    if main['temp_max'] > max_temp:
+                        max_temp = main['temp_max']
+                    descriptions[f['weather'][0]['description']] += 1
                 
-                # Get appropriate icon (mid-day if available, otherwise first)
-                mid_day = next((f for f in forecasts if datetime.datetime.utcfromtimestamp(f['dt']).hour in (12, 13, 14)), forecasts[0])
+                avg_temp = total_temp / len(forecasts)
+                main_desc = descriptions.most_common(1)[0][0]
                 
                 # Add field for the day
                 embed.add_field(
@@ -589,16 +873,11 @@ class Utility(commands.Cog):
         except Exception as e:
             self.logger.error(f"Error fetching forecast: {e}")
             
-            embed = create_embed(
-                title=_("Error", lang),
-                description=_("Could not fetch forecast information. Please check the location and try again.", lang),
-                color=disnake.Color.red()
-            )
-            await interaction.edit_original_message(embed=embed)
+            await interaction.edit_original_message(embed=_fetch_error_embed('forecast', lang))
         
         # Log command usage
         if interaction.guild:
-            await self.log_command(interaction.author.id, interaction.guild.id, "forecast")
+            self.log_command(interaction.author.id, interaction.guild.id, "forecast")
     
     @commands.slash_command(name="remind")
     async def remind(
@@ -619,8 +898,7 @@ class Utility(commands.Cog):
         lang = await get_guild_language(interaction.guild.id if interaction.guild else None)
         
         # Parse the time string
-        time_regex = re.compile(r"(\d+)([smhdw])")
-        match = time_regex.match(time.lower())
+        match = _TIME_RE.match(time.lower())
         
         if not match:
             embed = create_embed(
@@ -636,25 +914,11 @@ class Utility(commands.Cog):
         
         # Calculate the due time
         now = datetime.datetime.utcnow()
-        due_time = now
-        
-        if unit == 's':
-            due_time += datetime.timedelta(seconds=amount)
-            time_str = _("{amount} seconds", lang).format(amount=amount)
-        elif unit == 'm':
-            due_time += datetime.timedelta(minutes=amount)
-            time_str = _("{amount} minutes", lang).format(amount=amount)
-        elif unit == 'h':
-            due_time += datetime.timedelta(hours=amount)
-            time_str = _("{amount} hours", lang).format(amount=amount)
-        elif unit == 'd':
-            due_time += datetime.timedelta(days=amount)
-            time_str = _("{amount} days", lang).format(amount=amount)
-        elif unit == 'w':
-            due_time += datetime.timedelta(weeks=amount)
-            time_str = _("{amount} weeks", lang).format(amount=amount)
-        
-        # Add the reminder to the list
+        label, seconds = _UNITS[unit]
+        due_time = now + datetime.timedelta(seconds=amount * seconds)
+        time_str = _(label, lang).format(amount=amount)
+        
+        # Store the reminder so it survives restarts, then schedule it
         reminder = {
             'user_id': interaction.author.id,
             'channel_id': interaction.channel.id if interaction.guild else None,
@@ -665,7 +929,17 @@ class Utility(commands.Cog):
             'language': lang
         }
         
-        self.reminders.append(reminder)
+        try:
+            async with get_session() as session:
+                row = Reminder(**reminder)
+                session.add(row)
+                await session.flush()
+                reminder['id'] = row.id
+                await session.commit()
+        except Exception as e:
+            self.logger.error(f"Error saving reminder: {e}")
+        
+        self.schedule_reminder(reminder)
         
         # Create response
         embed = create_embed(
@@ -688,7 +962,7 @@ class Utility(commands.Cog):
         
         # Log command usage
         if interaction.guild:
-            await self.log_command(interaction.author.id, interaction.guild.id, "remind")
+            self.log_command(interaction.author.id, interaction.guild.id, "remind")
     
     @commands.slash_command(name="poll")
     @commands.guild_only()
@@ -742,10 +1016,9 @@ class Utility(commands.Cog):
         )
         
         # Add options to the embed
-        emoji_numbers = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
-        for i, option in enumerate(option_list):
+        for emoji, option in zip(_EMOJI_NUMBERS, option_list):
             embed.add_field(
-                name=f"{emoji_numbers[i]} {option}",
+                name=f"{emoji} {option}",
                 value="\u200b",  # Zero-width space
                 inline=False
             )
@@ -769,12 +1042,37 @@ class Utility(commands.Cog):
         # Get the sent message to add reactions
         message = await interaction.original_message()
         
-        # Add reactions
-        for i in range(len(option_list)):
-            await message.add_reaction(emoji_numbers[i])
+        # Tally votes from reaction events right away; the database id is attached once saved
+        poll = {'id': None, 'votes': [set() for _option in option_list]}
+        self.polls[message.id] = poll
+        
+        # Add reactions in the background, in order
+        self.spawn(self.add_reactions(message, _EMOJI_NUMBERS[:len(option_list)]))
+        
+        # Store the poll so its tally can be saved
+        try:
+            async with get_session() as session:
+                row = Poll(
+                    guild_id=interaction.guild.id,
+                    channel_id=message.channel.id,
+                    message_id=message.id,
+                    question=question,
+                    options=option_list,
+                    votes=[[] for _option in option_list],
+                    multiple_choice=multiple_choice,
+                    created_by=interaction.author.id
+                )
+                session.add(row)
+                await session.commit()
+                poll['id'] = row.id
+        except Exception as e:
+            self.logger.error(f"Error saving poll: {e}")
+            # Without a row there is nowhere to save the tally
+            self.polls.pop(message.id, None)
+            self._dirty_polls.discard(message.id)
         
         # Log command usage
-        await self.log_command(interaction.author.id, interaction.guild.id, "poll")
+        self.log_command(interaction.author.id, interaction.guild.id, "poll")
     
     @commands.slash_command(name="random")
     async def random(
@@ -799,6 +1097,7 @@ class Utility(commands.Cog):
         """
         # Get language
         lang = await get_guild_language(interaction.guild.id if interaction.guild else None)
+        rng = self._rng
         
         if choice == "number":
             # Check if min and max values are provided
@@ -812,7 +1111,7 @@ class Utility(commands.Cog):
                 return
             
             # Generate random number
-            result = random.randint(min_value, max_value)
+            result = rng.randint(min_value, max_value)
             
             embed = create_embed(
                 title=_("Random Number", lang),
@@ -827,7 +1126,8 @@ class Utility(commands.Cog):
         
         elif choice == "coin":
             # Flip a coin
-            result = random.choice([_("Heads", lang), _("Tails", lang)])
+            heads = rng.getrandbits(1)
+            result = _("Heads", lang) if heads else _("Tails", lang)
             
             embed = create_embed(
                 title=_("Coin Flip", lang),
@@ -840,15 +1140,16 @@ class Utility(commands.Cog):
                 inline=False
             )
             
-            # Add coin emoji based on result
-            if result == _("Heads", lang):
-                embed.set_thumbnail(url="https://emojipedia-us.s3.dualstack.us-west-1.amazonaws.com/thumbs/120/twitter/322/coin_1fa99.png")
-            else:
-                embed.set_thumbnail(url="https://emojipedia-us.s3.dualstack.us-west-1.amazonaws.com/thumbs/120/twitter/322/coin_1fa99.png")
+            # Add coin emoji (same image for both sides)
+            embed.set_thumbnail(url=_COIN_THUMBNAIL)
         
         elif choice == "dice":
             # Roll a die
-            result = random.randint(1, 6)
+            # Rejection-sample 3 random bits instead of going through randint
+            result = rng.getrandbits(3)
+            while result >= 6:
+                result = rng.getrandbits(3)
+            result += 1
             
             embed = create_embed(
                 title=_("Dice Roll", lang),
@@ -862,25 +1163,21 @@ class Utility(commands.Cog):
             )
             
             # Add dice emoji
-            dice_emojis = ["⚀", "⚁", "⚂", "⚃", "⚄", "⚅"]
-            embed.description += f" {dice_emojis[result-1]}"
+            embed.description += f" {_DICE_EMOJIS[result-1]}"
         
         elif choice == "card":
             # Draw a card
-            suits = [_("Hearts", lang), _("Diamonds", lang), _("Clubs", lang), _("Spades", lang)]
-            values = ["2", "3", "4", "5", "6", "7", "8", "9", "10", _("Jack", lang), _("Queen", lang), _("King", lang), _("Ace", lang)]
-            
-            suit = random.choice(suits)
-            value = random.choice(values)
+            suit = rng.choice(_CARD_SUITS)
+            value = rng.choice(_CARD_VALUES)
             
             embed = create_embed(
                 title=_("Card Draw", lang),
                 description=_("Drawing a card from the deck...", lang),
-                color=disnake.Color.dark_red() if suit in [_("Hearts", lang), _("Diamonds", lang)] else disnake.Color.dark_gray()
+                color=disnake.Color.dark_red() if suit in _RED_SUITS else disnake.Color.dark_gray()
             )
             embed.add_field(
                 name=_("Result", lang),
-                value=_("{value} of {suit}", lang).format(value=value, suit=suit),
+                value=_("{value} of {suit}", lang).format(value=_(value, lang), suit=_(suit, lang)),
                 inline=False
             )
         
@@ -895,36 +1192,8 @@ class Utility(commands.Cog):
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
             
-            # 8-Ball responses
-            responses = [
-                # Positive answers
-                _("It is certain.", lang),
-                _("It is decidedly so.", lang),
-                _("Without a doubt.", lang),
-                _("Yes - definitely.", lang),
-                _("You may rely on it.", lang),
-                _("As I see it, yes.", lang),
-                _("Most likely.", lang),
-                _("Outlook good.", lang),
-                _("Yes.", lang),
-                _("Signs point to yes.", lang),
-                
-                # Neutral answers
-                _("Reply hazy, try again.", lang),
-                _("Ask again later.", lang),
-                _("Better not tell you now.", lang),
-                _("Cannot predict now.", lang),
-                _("Concentrate and ask again.", lang),
-                
-                # Negative answers
-                _("Don't count on it.", lang),
-                _("My reply is no.", lang),
-                _("My sources say no.", lang),
-                _("Outlook not so good.", lang),
-                _("Very doubtful.", lang)
-            ]
-            
-            result = random.choice(responses)
+            # Pick an answer, then translate only that one
+            result = _(rng.choice(_EIGHT_BALL_ANSWERS), lang)
             
             embed = create_embed(
                 title=_("Magic 8-Ball", lang),
@@ -936,14 +1205,14 @@ class Utility(commands.Cog):
                 value=result,
                 inline=False
             )
-            embed.set_thumbnail(url="https://emojipedia-us.s3.dualstack.us-west-1.amazonaws.com/thumbs/120/twitter/322/pool-8-ball_1f3b1.png")
+            embed.set_thumbnail(url=_EIGHT_BALL_THUMBNAIL)
         
         # Send response
         await interaction.response.send_message(embed=embed)
         
         # Log command usage
         if interaction.guild:
-            await self.log_command(interaction.author.id, interaction.guild.id, f"random_{choice}")
+            self.log_command(interaction.author.id, interaction.guild.id, f"random_{choice}")
     
     @commands.slash_command(name="setlanguage")
     async def setlanguage(
@@ -1048,16 +1317,72 @@ class Utility(commands.Cog):
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
     
-    async def log_command(self, user_id, guild_id, command_name):
-        """Log command usage to the database"""
+    async def add_reactions(self, message, emojis):
+        """Add reactions to a message one by one so they keep their order"""
+        try:
+            for emoji in emojis:
+                await message.add_reaction(emoji)
+        except Exception as e:
+            self.logger.error(f"Error adding reactions: {e}")
+    
+    def log_command(self, user_id, guild_id, command_name):
+        """Queue a command usage row for the next batched write"""
+        self._usage_buffer.append({
+            'guild_id': guild_id,
+            'user_id': user_id,
+            'command_name': command_name,
+            'used_at': datetime.datetime.utcnow()
+        })
+        if len(self._usage_buffer) >= USAGE_FLUSH_SIZE:
+            self._usage_flush.set()
+    
+    async def usage_task(self):
+        """Flush buffered command usage and changed poll votes every few seconds"""
+        while True:
+            try:
+                await asyncio.wait_for(self._usage_flush.wait(), timeout=USAGE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._usage_flush.clear()
+            await self.flush_command_usage()
+            await self.flush_poll_votes()
+    
+    async def flush_poll_votes(self):
+        """Save the tallies of polls whose votes changed since the last flush"""
+        if not self._dirty_polls:
+            return
+        
+        dirty, self._dirty_polls = self._dirty_polls, set()
         try:
             async with get_session() as session:
-                command_usage = CommandUsage(
-                    guild_id=guild_id,
-                    user_id=user_id,
-                    command_name=command_name
-                )
-                session.add(command_usage)
+                for message_id in dirty:
+                    poll = self.polls.get(message_id)
+                    if poll is None:
+                        continue
+                    if poll['id'] is None:
+                        # Not saved yet: keep it for the next flush
+                        self._dirty_polls.add(message_id)
+                        continue
+                    await session.execute(
+                        update(Poll)
+                        .where(Poll.id == poll['id'])
+                        .values(votes=[sorted(voters) for voters in poll['votes']])
+                    )
+                await session.commit()
+        except Exception as e:
+            self.logger.error(f"Error saving poll votes: {e}")
+            # Mark them dirty again so the next flush retries them
+            self._dirty_polls |= dirty
+    
+    async def flush_command_usage(self):
+        """Write all buffered command usage rows in a single INSERT"""
+        if not self._usage_buffer:
+            return
+        
+        rows, self._usage_buffer = self._usage_buffer, []
+        try:
+            async with get_session() as session:
+                await session.execute(insert(CommandUsage), rows)
                 await session.commit()
         except Exception as e:
             self.logger.error(f"Error logging command usage: {e}")
@@ -1,23 +1,64 @@
 import asyncio
+import time
+from collections import OrderedDict
 import disnake
 from disnake.ext import commands
 import logging
-import aiohttp
-from datetime import datetime
-from typing import Optional
+from yarl import URL
+from datetime import datetime, timezone
+from typing import Dict, NamedTuple, Optional
+
+# orjson разбирает ответы API заметно быстрее, но необязателен
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
 
 from bot.utils.logger import get_logger_for_cog
 
 logger = get_logger_for_cog("utility.weather")
 
+# Время жизни кэша ответов API (секунды) и максимальное число записей
+WEATHER_CACHE_TTL = 300
+WEATHER_CACHE_SIZE = 256
+
+class WeatherLabels(NamedTuple):
+    """Локализованные названия полей эмбеда погоды для одного языка"""
+    temperature: str
+    feels_like: str
+    humidity: str
+    wind: str
+    pressure: str
+
+# Ключи языковых файлов для полей WeatherLabels
+WEATHER_LABEL_KEYS = WeatherLabels(
+    temperature="utility.weather.temperature",
+    feels_like="utility.weather.feels_like",
+    humidity="utility.weather.humidity",
+    wind="utility.weather.wind",
+    pressure="utility.weather.pressure",
+)
+
 class Weather(commands.Cog):
     """Команды для получения информации о погоде"""
     
     def __init__(self, bot):
         self.bot = bot
         self.api_key = None
-        self.session = None
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        # Адреса запросов с постоянными параметрами: units -> URL (заполняется в initialize)
+        self._query_urls: Dict[str, URL] = {}
+        # Цвет эмбеда из конфигурации (конфигурация не меняется после загрузки)
+        self.embed_color = disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('info', 0x7289da))
+        
+        # LRU-кэш ответов: (location, units) -> (expires_at, data, etag, last_modified)
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Выполняющиеся запросы по ключу: параллельные вызовы для одного города ждут один HTTP-запрос
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # Названия полей эмбеда по языкам
+        self._labels: Dict[str, WeatherLabels] = {}
         
         # Запуск задачи инициализации
         asyncio.create_task(self.initialize())
@@ -27,19 +68,22 @@ class Weather(commands.Cog):
         # Ожидание готовности бота
         await self.bot.wait_until_ready()
         
-        # Создание HTTP сессии
-        self.session = aiohttp.ClientSession()
-        
         # Получение API ключа
         self.api_key = self.bot.config.get("modules", {}).get("utility", {}).get("weather_api_key", "")
         
+        # Постоянные параметры кодируются один раз, в запросе меняется только q
+        base_url = URL(self.base_url)
+        self._query_urls = {
+            units: base_url.with_query(
+                appid=self.api_key,
+                units=units,
+                lang="ru"  # Можно также использовать локализацию из бота
+            )
+            for units in ("metric", "imperial")
+        }
+        
         logger.info("Модуль погоды инициализирован" if self.api_key else "Модуль погоды инициализирован, но API-ключ не найден")
     
-    async def cog_unload(self):
-        """Вызывается при выгрузке cog"""
-        if self.session:
-            await self.session.close()
-    
     @commands.slash_command(name="weather", description="Получить информацию о погоде в указанном месте")
     async def weather(
         self, 
@@ -52,9 +96,11 @@ class Weather(commands.Cog):
         )
     ):
         """Получить информацию о погоде в указанном месте"""
+        # Язык сервера нужен в любой ветке, поэтому получаем его один раз
+        guild_language = await self.bot.get_guild_language(inter.guild.id if inter.guild else None)
+        
         # Проверка API ключа
         if not self.api_key:
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
             error_text = self.bot.language_manager.get_text(
                 "utility.weather.api_key_missing", 
                 guild_language
@@ -69,7 +115,6 @@ class Weather(commands.Cog):
             weather_data = await self._get_weather_data(location, units)
             
             if not weather_data:
-                guild_language = await self.bot.get_guild_language(inter.guild.id)
                 not_found_text = self.bot.language_manager.get_text(
                     "utility.weather.not_found", 
                     guild_language,
@@ -78,7 +123,7 @@ class Weather(commands.Cog):
                 return await inter.followup.send(not_found_text)
             
             # Создание эмбеда с информацией о погоде
-            embed = await self._create_weather_embed(inter, weather_data, location, units)
+            embed = self._create_weather_embed(weather_data, location, units, guild_language)
             
             # Отправка ответа
             await inter.followup.send(embed=embed)
@@ -86,7 +131,6 @@ class Weather(commands.Cog):
         except Exception as e:
             logger.error(f"Ошибка при получении данных о погоде для {location}: {e}")
             
-            guild_language = await self.bot.get_guild_language(inter.guild.id)
             error_text = self.bot.language_manager.get_text(
                 "utility.weather.error", 
                 guild_language,
@@ -96,52 +140,137 @@ class Weather(commands.Cog):
     
     async def _get_weather_data(self, location, units):
         """
-        Получение данных о погоде через API
+        Получение данных о погоде с кэшированием на WEATHER_CACHE_TTL секунд
+        
+        Args:
+            location (str): Местоположение (город, страна)
+            units (str): Единицы измерения (metric, imperial)
+        
+        Returns:
+            dict: Данные о погоде
+        """
+        key = (location.strip().lower(), units)
+        
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return cached[1]
+        
+        # Если запрос для этого ключа уже выполняется, ждём его результат (в том числе неудачный)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh_weather_data(key, location, units, cached))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(key, None))
+        
+        # shield: отмена одного вызывающего не должна отменять общий запрос
+        return await asyncio.shield(task)
+    
+    async def _refresh_weather_data(self, key, location, units, cached):
+        """
+        Запрос данных о погоде и сохранение их в кэш
         
         Args:
+            key (tuple): Ключ кэша
             location (str): Местоположение (город, страна)
             units (str): Единицы измерения (metric, imperial)
+            cached (tuple): Устаревшая запись кэша или None
         
         Returns:
             dict: Данные о погоде
         """
+        # Устаревшую запись проверяем условным запросом
+        data, etag, last_modified = await self._fetch_weather_data(location, units, cached)
+        
+        # Неудачные ответы не кэшируем
+        if data:
+            self._cache[key] = (time.monotonic() + WEATHER_CACHE_TTL, data, etag, last_modified)
+            self._cache.move_to_end(key)
+            # Жёсткий предел: вытесняем давно не использованные записи
+            while len(self._cache) > WEATHER_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
+        return data
+    
+    async def _fetch_weather_data(self, location, units, cached=None):
+        """
+        Получение данных о погоде через API
+        
+        Args:
+            location (str): Местоположение (город, страна)
+            units (str): Единицы измерения (metric, imperial)
+            cached (tuple, optional): Устаревшая запись кэша для условного запроса
+        
+        Returns:
+            tuple: Данные о погоде (или None), ETag и Last-Modified ответа
+        """
+        headers = {}
+        if cached:
+            if cached[2]:
+                headers["If-None-Match"] = cached[2]
+            if cached[3]:
+                headers["If-Modified-Since"] = cached[3]
+        
         try:
-            params = {
-                "q": location,
-                "appid": self.api_key,
-                "units": units,
-                "lang": "ru"  # Можно также использовать локализацию из бота
-            }
+            url = self._query_urls[units].update_query(q=location)
             
-            async with self.session.get(self.base_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data
-                elif response.status == 404:
+            async with self.bot.http_session.get(url, headers=headers) as response:
+                status = response.status
+                
+                # Самый частый ответ проверяется первым
+                if status == 200:
+                    data = await response.json(loads=json_loads)
+                    return data, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                elif status == 304:
+                    # Данные не изменились: тело пустое, повторно разбирать нечего
+                    return cached[1], cached[2], cached[3]
+                elif status == 404:
                     logger.warning(f"Местоположение не найдено: {location}")
-                    return None
+                    return None, None, None
                 else:
-                    logger.error(f"Ошибка API OpenWeatherMap: {response.status} - {await response.text()}")
-                    return None
+                    logger.error(f"Ошибка API OpenWeatherMap: {status} {response.reason}")
+                    # Тело ответа читаем только для отладки и не целиком
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Ответ OpenWeatherMap: {(await response.text())[:256]}")
+                    return None, None, None
                 
         except Exception as e:
             logger.error(f"Ошибка при запросе данных о погоде: {e}")
-            return None
+            return None, None, None
+    
+    def _labels_for(self, language):
+        """
+        Получение названий полей эмбеда для языка
+        
+        Args:
+            language (str): Код языка
+        
+        Returns:
+            WeatherLabels: Названия, загруженные один раз на язык
+        """
+        labels = self._labels.get(language)
+        
+        if labels is None:
+            get_template = self.bot.language_manager.get_template
+            labels = WeatherLabels._make(get_template(key, language) for key in WEATHER_LABEL_KEYS)
+            self._labels[language] = labels
+        
+        return labels
     
-    async def _create_weather_embed(self, inter, weather_data, location, units):
+    def _create_weather_embed(self, weather_data, location, units, guild_language):
         """
         Создание эмбеда с информацией о погоде
         
         Args:
-            inter (disnake.ApplicationCommandInteraction): Объект взаимодействия
             weather_data (dict): Данные о погоде
             location (str): Местоположение (город, страна)
             units (str): Единицы измерения (metric, imperial)
+            guild_language (str): Код языка сервера
         
         Returns:
             disnake.Embed: Эмбед с информацией о погоде
         """
-        guild_language = await self.bot.get_guild_language(inter.guild.id)
+        labels = self._labels_for(guild_language)
         
         # Получение данных о погоде
         city_name = weather_data["name"]
@@ -170,7 +299,7 @@ class Weather(commands.Cog):
                 guild_language,
                 condition=weather_description.capitalize()
             ),
-            color=disnake.Color(self.bot.config.get('embed', {}).get('colors', {}).get('info', 0x7289da))
+            color=self.embed_color
         )
         
         # Добавление иконки погоды
@@ -178,38 +307,39 @@ class Weather(commands.Cog):
         
         # Добавление полей
         embed.add_field(
-            name=self.bot.language_manager.get_text("utility.weather.temperature", guild_language),
+            name=labels.temperature,
             value=f"{temperature:.1f}{temperature_unit}",
             inline=True
         )
         
         embed.add_field(
-            name=self.bot.language_manager.get_text("utility.weather.feels_like", guild_language),
+            name=labels.feels_like,
             value=f"{feels_like:.1f}{temperature_unit}",
             inline=True
         )
         
         embed.add_field(
-            name=self.bot.language_manager.get_text("utility.weather.humidity", guild_language),
+            name=labels.humidity,
             value=f"{humidity}%",
             inline=True
         )
         
         embed.add_field(
-            name=self.bot.language_manager.get_text("utility.weather.wind", guild_language),
+            name=labels.wind,
             value=f"{wind_speed} {wind_unit}",
             inline=True
         )
         
         embed.add_field(
-            name=self.bot.language_manager.get_text("utility.weather.pressure", guild_language),
+            name=labels.pressure,
             value=f"{pressure} гПа",
             inline=True
         )
         
         # Добавление футера и временной метки
         embed.set_footer(text="OpenWeatherMap API")
-        embed.timestamp = datetime.utcnow()
+        # Время измерения из ответа API, чтобы закэшированные данные не выглядели свежее, чем есть
+        embed.timestamp = datetime.fromtimestamp(weather_data.get("dt", time.time()), tz=timezone.utc)
         
         return embed
 
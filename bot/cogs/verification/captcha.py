@@ -4,21 +4,116 @@ from disnake.ext import commands
 import logging
 import random
 import string
+import threading
 from datetime import datetime, timedelta
 import io
 from PIL import Image, ImageDraw, ImageFont
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 
 from bot.utils.logger import get_logger_for_cog
 
+# NumPy позволяет генерировать шум фона целиком, без цикла по точкам
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = get_logger_for_cog("verification")
 
+# Количество заранее сгенерированных фонов на каждый размер изображения
+BACKGROUND_POOL_SIZE = 64
+
+# Алфавит кода без похожих символов (0, O, 1, I и т.п.) и предельный наклон символа
+CAPTCHA_CHARS = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+CAPTCHA_MAX_ANGLE = 30
+
+# Кэш повёрнутых масок вмещает все пары (символ, угол) для двух сочетаний шрифта и размера:
+# 32 * 61 * 2 = 3904 маски, около 5 КБ каждая при стандартном размере
+GLYPH_CACHE_FONTS = 2
+ROTATED_GLYPH_CACHE_SIZE = len(CAPTCHA_CHARS) * (2 * CAPTCHA_MAX_ANGLE + 1) * GLYPH_CACHE_FONTS
+
+@lru_cache(maxsize=32)
+def load_font(font_path: Optional[str], font_size: int):
+    """
+    Загрузка шрифта с кэшированием по пути и размеру
+    
+    Args:
+        font_path (str): Путь к файлу шрифта или None для стандартного шрифта
+        font_size (int): Размер шрифта
+    
+    Returns:
+        ImageFont: Загруженный шрифт
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except Exception as e:
+            logger.error(f"Ошибка при загрузке шрифта {font_path}: {e}")
+    
+    return ImageFont.load_default()
+
+@lru_cache(maxsize=len(CAPTCHA_CHARS) * GLYPH_CACHE_FONTS)
+def render_glyph(font_path: Optional[str], font_size: int, char: str) -> Image.Image:
+    """
+    Растеризация символа в маску прозрачности с кэшированием
+    
+    Алфавит CAPTCHA небольшой, поэтому FreeType рисует каждый символ
+    один раз, а цвет накладывается уже на готовую маску. Символ
+    центрируется на холсте по своим границам, поэтому маска не зависит
+    от кода, в котором он встретился.
+    
+    Args:
+        font_path (str): Путь к файлу шрифта или None для стандартного шрифта
+        font_size (int): Размер шрифта (и сторона квадратного холста)
+        char (str): Символ
+    
+    Returns:
+        Image.Image: Маска символа в режиме 'L'
+    """
+    font = load_font(font_path, font_size)
+    if hasattr(font, 'getbbox'):
+        left, top, right, bottom = font.getbbox(char)
+    else:
+        (right, bottom), left, top = font.getsize(char), 0, 0
+    
+    mask = Image.new('L', (font_size, font_size), 0)
+    text_pos = ((font_size - left - right) // 2, (font_size - top - bottom) // 2)
+    ImageDraw.Draw(mask).text(text_pos, char, font=font, fill=255)
+    return mask
+
+@lru_cache(maxsize=ROTATED_GLYPH_CACHE_SIZE)
+def render_rotated_glyph(font_path: Optional[str], font_size: int, char: str, angle: int) -> Image.Image:
+    """
+    Повёрнутая маска символа с кэшированием
+    
+    Угол наклона принимает всего 61 значение, поэтому поворот каждой
+    маски выполняется один раз. Положение символа в коде задаётся при
+    вставке маски.
+    
+    Args:
+        font_path (str): Путь к файлу шрифта или None для стандартного шрифта
+        font_size (int): Размер шрифта
+        char (str): Символ
+        angle (int): Угол поворота в градусах
+    
+    Returns:
+        Image.Image: Повёрнутая маска символа в режиме 'L'
+    """
+    return render_glyph(font_path, font_size, char).rotate(angle, expand=1)
+
 class CaptchaGenerator:
     """Класс для генерации изображений с CAPTCHA"""
     
     def __init__(self):
         """Инициализация генератора CAPTCHA"""
+        self.rng = np.random.default_rng() if np is not None else None
+        # Пулы зашумлённых фонов: (width, height) -> [Image]
+        self.background_pools: Dict[Tuple[int, int], list] = {}
+        # Генерация идёт в рабочих потоках (asyncio.to_thread), поэтому пулы защищены блокировкой
+        self._pool_lock = threading.Lock()
+        
         self.fonts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "assets", "fonts")
         # Создание директории для шрифтов, если она не существует
         os.makedirs(self.fonts_dir, exist_ok=True)
@@ -28,6 +123,18 @@ class CaptchaGenerator:
         
         if not self.fonts:
             logger.warning("Шрифты не найдены, будет использован стандартный шрифт")
+        
+        # Запасной шрифт ищется один раз, а не при каждой генерации
+        self.fallback_font_path = None if self.fonts else self._get_fallback_font()
+    
+    def _get_fallback_font(self):
+        """Получение пути к встроенному шрифту PIL, если он доступен"""
+        try:
+            import pkg_resources
+            return pkg_resources.resource_filename('PIL', 'DejaVuSans.ttf')
+        except (ImportError, FileNotFoundError):
+            # Если не найден встроенный шрифт, используем шрифт по умолчанию
+            return None
     
     def _get_available_fonts(self):
         """Получение списка доступных шрифтов"""
@@ -53,8 +160,7 @@ class CaptchaGenerator:
             str: Сгенерированный код
         """
         # Используем только буквы и цифры, исключая похожие символы (0, O, 1, I, etc.)
-        chars = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
-        return ''.join(random.choice(chars) for _ in range(length))
+        return ''.join(random.choice(CAPTCHA_CHARS) for _ in range(length))
     
     def generate_captcha_image(self, code: str, width: int = 300, height: int = 100) -> bytes:
         """
@@ -69,31 +175,14 @@ class CaptchaGenerator:
             bytes: Бинарные данные изображения
         """
         # Создание фонового изображения
-        background = self._create_noisy_background(width, height)
+        background = self._get_background(width, height)
         draw = ImageDraw.Draw(background)
         
         # Выбор шрифта
         font_size = height // 2
-        if self.fonts:
-            font_path = random.choice(self.fonts)
-        else:
-            # Использование встроенного шрифта, если шрифты не найдены
-            try:
-                import pkg_resources
-                font_path = pkg_resources.resource_filename('PIL', 'DejaVuSans.ttf')
-            except (ImportError, FileNotFoundError):
-                # Если не найден встроенный шрифт, используем шрифт по умолчанию
-                font = ImageFont.load_default()
-                font_path = None
-        
-        if font_path:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-            except Exception as e:
-                logger.error(f"Ошибка при загрузке шрифта {font_path}: {e}")
-                font = ImageFont.load_default()
-        else:
-            font = ImageFont.load_default()
+        # Использование встроенного шрифта, если шрифты не найдены
+        font_path = random.choice(self.fonts) if self.fonts else self.fallback_font_path
+        font = load_font(font_path, font_size)
         
         # Расчет позиции текста
         text_width, text_height = draw.textsize(code, font=font) if hasattr(draw, 'textsize') else font.getsize(code)
@@ -110,32 +199,55 @@ class CaptchaGenerator:
             color = self._get_random_dark_color()
             
             # Случайный наклон
-            angle = random.randint(-30, 30)
-            
-            # Создание отдельного изображения для символа и его поворот
-            char_img = Image.new('RGBA', (font_size, font_size), (0, 0, 0, 0))
-            char_draw = ImageDraw.Draw(char_img)
+            angle = random.randint(-CAPTCHA_MAX_ANGLE, CAPTCHA_MAX_ANGLE)
             
-            # Рисование символа
-            text_pos = ((font_size - (text_width // len(code))) // 2, (font_size - text_height) // 2)
-            char_draw.text(text_pos, char, font=font, fill=color)
+            # Закэшированная повёрнутая маска символа
+            mask = render_rotated_glyph(font_path, font_size, char, angle)
             
-            # Поворот символа
-            rotated = char_img.rotate(angle, expand=1)
-            
-            # Вставка символа в основное изображение
-            background.paste(rotated, (char_x, char_y), rotated)
+            # Вставка символа в основное изображение: заливка цветом через маску
+            background.paste(color, (char_x, char_y, char_x + mask.width, char_y + mask.height), mask)
         
         # Добавление линий для усложнения распознавания
         self._add_lines(draw, width, height)
         
         # Сохранение изображения в байтовый буфер
         buffer = io.BytesIO()
-        background.save(buffer, format="PNG")
+        # Шумное изображение почти не сжимается, поэтому быстрое сжатие почти не увеличивает размер
+        background.save(buffer, format="PNG", compress_level=1, optimize=False)
         buffer.seek(0)
         
         return buffer.getvalue()
     
+    def _get_background(self, width: int, height: int) -> Image.Image:
+        """
+        Получение копии зашумлённого фона из пула
+        
+        Шум не зависит от кода CAPTCHA, поэтому фоны генерируются, пока пул
+        не заполнится, а затем переиспользуются. Линии рисуются поверх
+        символов для каждой CAPTCHA отдельно.
+        
+        Args:
+            width (int): Ширина изображения
+            height (int): Высота изображения
+        
+        Returns:
+            Image.Image: Фоновое изображение
+        """
+        with self._pool_lock:
+            pool = self.background_pools.setdefault((width, height), [])
+            background = random.choice(pool) if len(pool) >= BACKGROUND_POOL_SIZE else None
+        
+        if background is None:
+            # Новый фон генерируется вне блокировки, чтобы не задерживать другие потоки
+            background = self._create_noisy_background(width, height)
+            
+            with self._pool_lock:
+                if len(pool) < BACKGROUND_POOL_SIZE:
+                    pool.append(background)
+        
+        # Изображения пула не изменяются, поэтому копировать можно без блокировки
+        return background.copy()
+    
     def _create_noisy_background(self, width: int, height: int) -> Image.Image:
         """
         Создание фонового изображения с шумом
@@ -147,12 +259,22 @@ class CaptchaGenerator:
         Returns:
             Image.Image: Фоновое изображение
         """
+        count = width * height // 10
+        
+        if self.rng is not None:
+            # Белый фон и случайные светлые точки, записанные в массив за одну операцию
+            pixels = np.full((height, width, 3), 255, dtype=np.uint8)
+            xs = self.rng.integers(0, width, count)
+            ys = self.rng.integers(0, height, count)
+            pixels[ys, xs] = self.rng.integers(180, 256, (count, 3), dtype=np.uint8)
+            return Image.fromarray(pixels, 'RGB')
+        
         # Создание белого фона
         background = Image.new('RGB', (width, height), color=(255, 255, 255))
         draw = ImageDraw.Draw(background)
         
         # Добавление случайных точек
-        for _ in range(width * height // 10):
+        for _ in range(count):
             x = random.randint(0, width - 1)
             y = random.randint(0, height - 1)
             draw.point((x, y), fill=self._get_random_light_color())
@@ -251,7 +373,8 @@ class Verification(commands.Cog):
         
         # Генерация кода CAPTCHA
         captcha_code = self.captcha_generator.generate_captcha_code()
-        captcha_image = self.captcha_generator.generate_captcha_image(captcha_code)
+        # Рисование и кодирование PNG выполняются в потоке, чтобы не блокировать цикл событий
+        captcha_image = await asyncio.to_thread(self.captcha_generator.generate_captcha_image, captcha_code)
         
         # Настройка таймаута верификации
         timeout_minutes = self.bot.config.get("modules", {}).get("verification", {}).get("timeout_minutes", 10)
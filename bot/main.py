@@ -5,6 +5,7 @@ import sys
 from datetime import datetime
 from typing import Dict, Optional
 
+import aiohttp
 import disnake
 from disnake.ext import commands
 from dotenv import load_dotenv
@@ -53,10 +54,19 @@ class UniversalBot(commands.InteractionBot):
         self.db = None
         self.language_manager = LanguageManager(self)
         self.module_states: Dict[int, Dict[str, bool]] = {}  # guild_id -> {module_name: enabled}
+        self._http_session: Optional[aiohttp.ClientSession] = None
         
         # Статус загрузки
         self.is_ready = False
         
+    @property
+    def http_session(self) -> aiohttp.ClientSession:
+        """Общая HTTP сессия для всех модулей (создаётся при первом обращении)"""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+    
     async def start_database(self):
         """Инициализация подключения к базе данных"""
         logger.info("Инициализация подключения к базе данных...")
@@ -173,6 +183,10 @@ class UniversalBot(commands.InteractionBot):
             await close_db_connection(self.db)
             logger.info("Соединение с базой данных закрыто")
         
+        # Закрытие общей HTTP сессии
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        
         await super().close()
         logger.info("Бот остановлен")
 
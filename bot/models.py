@@ -6,7 +6,7 @@ Database models for the Discord bot using SQLAlchemy ORM.
 """
 
 import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, BigInteger, Float, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, BigInteger, Float, JSON, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -242,7 +242,7 @@ class MusicSession(Base):
     
     id = Column(Integer, primary_key=True)
     guild_id = Column(BigInteger, nullable=False)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     ended_at = Column(DateTime, nullable=True)
     songs_played = Column(Integer, default=0)
     
@@ -262,6 +262,40 @@ class CommandUsage(Base):
     def __repr__(self):
         return f"<CommandUsage(guild_id={self.guild_id}, command='{self.command_name}')>"
 
+class Reminder(Base):
+    """Model for pending user reminders"""
+    __tablename__ = 'reminders'
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=True)
+    guild_id = Column(BigInteger, nullable=True)
+    message = Column(Text, nullable=False)
+    set_time = Column(Float, nullable=False)  # Unix timestamp
+    due_time = Column(Float, nullable=False, index=True)  # Unix timestamp
+    language = Column(String(10), default='en')
+    
+    def __repr__(self):
+        return f"<Reminder(user_id={self.user_id}, due_time={self.due_time})>"
+
+class Poll(Base):
+    """Model for reaction polls and their tallied votes"""
+    __tablename__ = 'polls'
+    
+    id = Column(Integer, primary_key=True)
+    guild_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=False)
+    message_id = Column(BigInteger, nullable=False, unique=True)
+    question = Column(Text, nullable=False)
+    options = Column(JSON, nullable=False)  # List of option labels
+    votes = Column(JSON, default=list)  # Voter IDs per option, same order as options
+    multiple_choice = Column(Boolean, default=False)
+    created_by = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Poll(message_id={self.message_id}, question='{self.question}')>"
+
 class WebUser(Base):
     """Model for web panel users"""
     __tablename__ = 'web_users'
@@ -166,6 +166,32 @@ CREATE TABLE IF NOT EXISTS command_usage (
     used_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Создание таблицы напоминаний
+CREATE TABLE IF NOT EXISTS reminders (
+    id SERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL,  -- Discord User ID
+    channel_id BIGINT,
+    guild_id BIGINT,
+    message TEXT NOT NULL,
+    set_time DOUBLE PRECISION NOT NULL,  -- Unix timestamp
+    due_time DOUBLE PRECISION NOT NULL,  -- Unix timestamp
+    language VARCHAR(10) DEFAULT 'en'
+);
+
+-- Создание таблицы опросов
+CREATE TABLE IF NOT EXISTS polls (
+    id SERIAL PRIMARY KEY,
+    guild_id BIGINT NOT NULL,
+    channel_id BIGINT NOT NULL,
+    message_id BIGINT NOT NULL UNIQUE,
+    question TEXT NOT NULL,
+    options JSON NOT NULL,  -- Список вариантов ответа
+    votes JSON,  -- ID проголосовавших по каждому варианту
+    multiple_choice BOOLEAN DEFAULT FALSE,
+    created_by BIGINT NOT NULL,  -- Discord User ID
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
 -- Создание таблицы пользователей веб-панели
 CREATE TABLE IF NOT EXISTS web_users (
     id BIGINT PRIMARY KEY,  -- Discord User ID
@@ -209,4 +235,5 @@ CREATE INDEX IF NOT EXISTS idx_command_usage_guild ON command_usage(guild_id);
 CREATE INDEX IF NOT EXISTS idx_command_usage_user ON command_usage(user_id);
 CREATE INDEX IF NOT EXISTS idx_verifications_guild_user ON verifications(guild_id, user_id);
 CREATE INDEX IF NOT EXISTS idx_verifications_active ON verifications(completed) WHERE completed = FALSE;
-CREATE INDEX IF NOT EXISTS idx_guild_stats_guild_date ON guild_stats(guild_id, date);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_guild_stats_guild_date ON guild_stats(guild_id, date);
+CREATE INDEX IF NOT EXISTS idx_reminders_due_time ON reminders(due_time);
\ No newline at end of file
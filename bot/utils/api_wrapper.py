@@ -11,10 +11,21 @@ import logging
 import aiohttp
 import asyncio
 import random
+import time
+from collections import OrderedDict
 from urllib.parse import urlencode
 
 logger = logging.getLogger('bot.api_wrapper')
 
+# OpenWeatherMap response cache shared by all wrapper instances, in LRU order:
+# (endpoint, location, units, lang) -> (expires_at monotonic time, data)
+WEATHER_CACHE = OrderedDict()
+WEATHER_CACHE_SIZE = 512
+# Requests currently in flight per cache key, shared by concurrent callers
+WEATHER_INFLIGHT = {}
+CURRENT_WEATHER_TTL = 600  # seconds
+FORECAST_TTL = 3600  # seconds
+
 class APIError(Exception):
     """Exception raised for API errors"""
     pass
@@ -106,26 +117,7 @@ class OpenWeatherMapAPI(BaseAPI):
         Returns:
             dict: Weather data
         """
-        params = {
-            'q': location,
-            'units': units,
-            'lang': lang,
-            'appid': self.api_key
-        }
-        
-        # If location is coordinates (lat,lon)
-        if ',' in location and all(c.replace('.', '').replace('-', '').isdigit() for c in location.split(',')):
-            lat, lon = location.split(',')
-            params = {
-                'lat': lat.strip(),
-                'lon': lon.strip(),
-                'units': units,
-                'lang': lang,
-                'appid': self.api_key
-            }
-        
-        url = f"{self.base_url}/weather?{urlencode(params)}"
-        return await self._request('get', url)
+        return await self._cached_request('weather', location, units, lang, CURRENT_WEATHER_TTL)
     
     async def get_forecast(self, location, units='metric', lang='en'):
         """
@@ -139,17 +131,24 @@ class OpenWeatherMapAPI(BaseAPI):
         Returns:
             dict: Forecast data
         """
-        params = {
-            'q': location,
-            'units': units,
-            'lang': lang,
-            'appid': self.api_key
-        }
+        return await self._cached_request('forecast', location, units, lang, FORECAST_TTL)
+    
+    def _location_params(self, location, units, lang):
+        """
+        Build query parameters for a city name or "lat,lon" location.
         
+        Args:
+            location (str): City name or coordinates
+            units (str): Units (metric, imperial, standard)
+            lang (str): Language code
+        
+        Returns:
+            dict: Query parameters
+        """
         # If location is coordinates (lat,lon)
         if ',' in location and all(c.replace('.', '').replace('-', '').isdigit() for c in location.split(',')):
             lat, lon = location.split(',')
-            params = {
+            return {
                 'lat': lat.strip(),
                 'lon': lon.strip(),
                 'units': units,
@@ -157,8 +156,73 @@ class OpenWeatherMapAPI(BaseAPI):
                 'appid': self.api_key
             }
         
-        url = f"{self.base_url}/forecast?{urlencode(params)}"
-        return await self._request('get', url)
+        return {
+            'q': location,
+            'units': units,
+            'lang': lang,
+            'appid': self.api_key
+        }
+    
+    async def _cached_request(self, endpoint, location, units, lang, ttl):
+        """
+        Fetch an endpoint, serving repeated lookups from the shared cache.
+        
+        Concurrent misses for the same key await one shared task, so only a
+        single HTTP request is in flight per key.
+        
+        Args:
+            endpoint (str): API endpoint (weather, forecast)
+            location (str): City name or coordinates
+            units (str): Units (metric, imperial, standard)
+            lang (str): Language code
+            ttl (int): Seconds to keep the response
+        
+        Returns:
+            dict: Response data
+        """
+        key = (endpoint, location.strip().lower(), units, lang)
+        
+        cached = WEATHER_CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            WEATHER_CACHE.move_to_end(key)
+            return cached[1]
+        
+        task = WEATHER_INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh_cached(key, endpoint, location, units, lang, ttl))
+            WEATHER_INFLIGHT[key] = task
+            task.add_done_callback(lambda _task: WEATHER_INFLIGHT.pop(key, None))
+        
+        # Shielded so one cancelled caller does not abort the shared request
+        return await asyncio.shield(task)
+    
+    async def _refresh_cached(self, key, endpoint, location, units, lang, ttl):
+        """
+        Fetch an endpoint and store the response in the shared cache.
+        
+        Args:
+            key (tuple): Cache key
+            endpoint (str): API endpoint (weather, forecast)
+            location (str): City name or coordinates
+            units (str): Units (metric, imperial, standard)
+            lang (str): Language code
+            ttl (int): Seconds to keep the response
+        
+        Returns:
+            dict: Response data
+        """
+        params = self._location_params(location, units, lang)
+        url = f"{self.base_url}/{endpoint}?{urlencode(params)}"
+        data = await self._request('get', url)
+        
+        WEATHER_CACHE[key] = (time.monotonic() + ttl, data)
+        WEATHER_CACHE.move_to_end(key)
+        
+        # Hard cap: evict least recently used entries
+        while len(WEATHER_CACHE) > WEATHER_CACHE_SIZE:
+            WEATHER_CACHE.popitem(last=False)
+        
+        return data
 
 class RedditAPI(BaseAPI):
     """Wrapper for Reddit API"""
@@ -9,6 +9,7 @@ Handles database connections, sessions, and operations.
 import os
 import logging
 import asyncio
+import time
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -23,6 +24,10 @@ logger = logging.getLogger('bot.db_manager')
 engine = None
 AsyncSessionFactory = None
 
+# Guild language cache: guild_id -> (language, expires_at monotonic time)
+_LANG_CACHE = {}
+_LANG_TTL = 300  # seconds
+
 async def init_db():
     """
     Initialize the database connection and create tables if they don't exist.
@@ -56,8 +61,10 @@ async def init_db():
         # Create engine and session factory
         engine = create_async_engine(
             database_url,
+            pool_size=20,
+            max_overflow=10,
             pool_pre_ping=True,
-            pool_recycle=300,  # Recycle connections after 5 minutes
+            pool_recycle=1800,  # Recycle connections after 30 minutes
             echo=False  # Set to True for debugging
         )
         
@@ -157,17 +164,31 @@ async def get_guild_language(guild_id):
     Returns:
         str: Language code (e.g., 'en', 'ru', 'de')
     """
+    entry = _LANG_CACHE.get(guild_id)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+    
     try:
         async with get_session() as session:
             query = select(Guild.language).where(Guild.id == guild_id)
             result = await session.execute(query)
-            language = result.scalar_one_or_none()
+            language = result.scalar_one_or_none() or 'en'
             
-            return language or 'en'
+            _LANG_CACHE[guild_id] = (language, time.monotonic() + _LANG_TTL)
+            return language
     except Exception as e:
         logger.error(f"Error getting guild language for {guild_id}: {e}")
         return 'en'
 
+def invalidate_guild_language(guild_id):
+    """
+    Drop the cached language for a guild so the next lookup hits the database.
+    
+    Args:
+        guild_id (int): Discord guild ID
+    """
+    _LANG_CACHE.pop(guild_id, None)
+
 async def get_member_language(user_id, guild_id):
     """
     Get the preferred language for a member.
@@ -227,6 +248,7 @@ async def set_guild_language(guild_id, language):
                 guild.language = language
             
             await session.commit()
+            invalidate_guild_language(guild_id)
             logger.info(f"Set language for guild {guild_id} to {language}")
             return True
     
@@ -1,7 +1,7 @@
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 # Настройка логирования
 logger = logging.getLogger("bot.language")
@@ -19,6 +19,7 @@ class LanguageManager:
         self.bot = bot
         self.logger = logging.getLogger("bot.language_manager")
         self.languages = {}
+        self.templates = {}  # language -> {"раздел.подраздел.параметр": шаблон}
         self.user_languages = {}  # user_id -> language
         self.guild_languages = {}  # guild_id -> language
         
@@ -41,6 +42,7 @@ class LanguageManager:
                 try:
                     with open(os.path.join(lang_dir, filename), 'r', encoding='utf-8') as file:
                         self.languages[language_code] = json.load(file)
+                    self.templates[language_code] = self._flatten(self.languages[language_code])
                     self.logger.info(f"Загружен языковой файл: {language_code}")
                 except Exception as e:
                     self.logger.error(f"Ошибка при загрузке языкового файла {filename}: {e}")
@@ -50,6 +52,27 @@ class LanguageManager:
         if default_language not in self.languages:
             self.logger.error(f"Язык по умолчанию {default_language} не найден!")
     
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+        """
+        Преобразование вложенного словаря строк в плоский словарь с ключами через точку
+        
+        Args:
+            data (Dict[str, Any]): Содержимое языкового файла
+            prefix (str): Префикс ключей
+        
+        Returns:
+            Dict[str, str]: Шаблоны по полным ключам
+        """
+        flat = {}
+        for name, value in data.items():
+            key = f"{prefix}{name}"
+            if isinstance(value, dict):
+                flat.update(LanguageManager._flatten(value, f"{key}."))
+            elif isinstance(value, str):
+                flat[key] = value
+        return flat
+    
     async def load_user_languages(self):
         """Загрузка пользовательских языковых настроек из базы данных"""
         # Это будет реализовано позже, когда появится подключение к базе данных
@@ -60,24 +83,35 @@ class LanguageManager:
         # Это будет реализовано позже, когда появится подключение к базе данных
         pass
     
-    def get_text(self, key: str, language: str = None, **kwargs) -> str:
+    def _resolve_language(self, language: Optional[str], default_language: str) -> str:
+        """Проверка кода языка с откатом на язык по умолчанию"""
+        if language is None:
+            return default_language
+        
+        if language not in self.languages:
+            self.logger.warning(f"Язык {language} не найден, используется язык по умолчанию")
+            return default_language
+        
+        return language
+    
+    def get_template(self, key: str, language: str = None) -> str:
         """
-        Получение локализованного текста по ключу
+        Получение неформатированного шаблона текста по ключу
         
         Args:
             key (str): Ключ в формате "раздел.подраздел.параметр"
             language (str, optional): Код языка. По умолчанию используется язык по умолчанию.
-            **kwargs: Параметры для форматирования текста
         
         Returns:
-            str: Локализованный текст
+            str: Шаблон текста без подстановки параметров
         """
-        if language is None:
-            language = self.bot.config.get("bot", {}).get("default_language", "ru")
+        default_language = self.bot.config.get("bot", {}).get("default_language", "ru")
+        language = self._resolve_language(language, default_language)
         
-        if language not in self.languages:
-            self.logger.warning(f"Язык {language} не найден, используется язык по умолчанию")
-            language = self.bot.config.get("bot", {}).get("default_language", "ru")
+        # Быстрый путь: шаблоны разворачиваются в плоский словарь при загрузке
+        template = self.templates.get(language, {}).get(key)
+        if template is not None:
+            return template
         
         # Разбиение ключа на части
         parts = key.split('.')
@@ -90,23 +124,75 @@ class LanguageManager:
             else:
                 self.logger.warning(f"Ключ {key} не найден в языке {language}")
                 # Если ключ не найден в выбранном языке, пробуем язык по умолчанию
-                if language != self.bot.config.get("bot", {}).get("default_language", "ru"):
-                    return self.get_text(key, self.bot.config.get("bot", {}).get("default_language", "ru"), **kwargs)
+                if language != default_language:
+                    return self.get_template(key, default_language)
                 return f"Missing text: {key}"
         
-        # Форматирование текста
         if isinstance(current, str):
+            return current
+        
+        self.logger.error(f"Ключ {key} не является строкой")
+        return f"Invalid text type: {key}"
+    
+    def get_text(self, key: str, language: str = None, **kwargs) -> str:
+        """
+        Получение локализованного текста по ключу
+        
+        Args:
+            key (str): Ключ в формате "раздел.подраздел.параметр"
+            language (str, optional): Код языка. По умолчанию используется язык по умолчанию.
+            **kwargs: Параметры для форматирования текста
+        
+        Returns:
+            str: Локализованный текст
+        """
+        text = self.get_template(key, language)
+        
+        # Форматирование текста
+        try:
+            return text.format(**kwargs)
+        except KeyError as e:
+            self.logger.error(f"Ошибка при форматировании текста {key}: отсутствует параметр {e}")
+            return text
+        except Exception as e:
+            self.logger.error(f"Ошибка при форматировании текста {key}: {e}")
+            return text
+    
+    def get_texts(self, keys: Iterable[str], language: str = None, **kwargs) -> Dict[str, str]:
+        """
+        Получение нескольких локализованных текстов с общими параметрами
+        
+        Args:
+            keys (Iterable[str]): Ключи в формате "раздел.подраздел.параметр"
+            language (str, optional): Код языка. По умолчанию используется язык по умолчанию.
+            **kwargs: Параметры для форматирования, общие для всех текстов
+        
+        Returns:
+            Dict[str, str]: Локализованные тексты по ключам
+        """
+        # Язык проверяется один раз для всех ключей
+        default_language = self.bot.config.get("bot", {}).get("default_language", "ru")
+        language = self._resolve_language(language, default_language)
+        
+        # Плоский словарь шаблонов языка берётся один раз, полный поиск только при промахе
+        bundle = self.templates.get(language, {})
+        
+        texts = {}
+        for key in keys:
+            text = bundle.get(key)
+            if text is None:
+                text = self.get_template(key, language)
+            
             try:
-                return current.format(**kwargs)
+                texts[key] = text.format_map(kwargs)
             except KeyError as e:
                 self.logger.error(f"Ошибка при форматировании текста {key}: отсутствует параметр {e}")
-                return current
+                texts[key] = text
             except Exception as e:
                 self.logger.error(f"Ошибка при форматировании текста {key}: {e}")
-                return current
-        else:
-            self.logger.error(f"Ключ {key} не является строкой")
-            return f"Invalid text type: {key}"
+                texts[key] = text
+        
+        return texts
     
     async def set_user_language(self, user_id: int, language: str) -> bool:
         """
@@ -30,6 +30,8 @@ class Localization:
         self.logger = logging.getLogger('bot.localization')
         self.languages = {}
         self.default_language = 'en'
+        # Memoized (key, lang_code) -> text lookups; cleared whenever catalogs change
+        self.lookup = lru_cache(maxsize=4096)(self.get_text)
         self.load_all_languages()
     
     def load_all_languages(self):
@@ -48,7 +50,6 @@ class Localization:
         except Exception as e:
             self.logger.error(f"Error loading language files: {e}")
     
-    @lru_cache(maxsize=16)
     def load_language(self, lang_code):
         """
         Load a specific language file.
@@ -68,6 +69,9 @@ class Localization:
             with open(lang_file, 'r', encoding='utf-8') as file:
                 self.languages[lang_code] = json.load(file)
             
+            # Drop lookups memoized before this catalog was loaded (e.g. cached raw keys)
+            self.lookup.cache_clear()
+            
             self.logger.debug(f"Loaded language {lang_code} from {lang_file}")
             return True
         except json.JSONDecodeError:
@@ -110,6 +114,7 @@ class Localization:
         """Set the default language"""
         if lang_code in self.languages:
             self.default_language = lang_code
+            self.lookup.cache_clear()
             return True
         return False
 
@@ -153,7 +158,7 @@ def setup_global_translations(localization_instance):
         Returns:
             str: Translated and formatted text
         """
-        text = localization_instance.get_text(key, lang_code)
+        text = localization_instance.lookup(key, lang_code)
         try:
             if kwargs:
                 return text.format(**kwargs)